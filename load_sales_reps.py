@@ -6,15 +6,16 @@ Usage:
     python load_sales_reps.py
 """
 
-import asyncio
 import csv
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.cli import _run
 from src.config import load_settings
 from src.sqlite_repository import SQLiteCallRepository
 
@@ -34,87 +35,75 @@ async def load_sales_reps(csv_file: str = "sales_rep_data.csv"):
 
         print(f"📂 Loading sales rep data from: {csv_file}")
 
-        # Read CSV
-        sales_reps = []
-        with open(csv_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Parse CSV line: email, segment, joining_date
-                parts = [p.strip() for p in line.split(',')]
-                if len(parts) != 3:
-                    print(f"⚠️  Warning: Line {line_num} has {len(parts)} fields (expected 3), skipping")
-                    continue
-
-                email, segment, joining_date_str = parts
-
-                # Parse date (format: MM/DD/YYYY)
-                try:
-                    joining_date = datetime.strptime(joining_date_str, "%m/%d/%Y")
-                except ValueError:
-                    print(f"⚠️  Warning: Line {line_num} has invalid date format '{joining_date_str}', skipping")
-                    continue
-
-                sales_reps.append({
-                    'email': email,
-                    'segment': segment,
-                    'joining_date': joining_date
-                })
-
-        if not sales_reps:
+        # Read CSV into parallel columns
+        emails, segments, joining_dates = [], [], []
+        # Read the whole file in one buffered read and decode once;
+        # csv.reader tokenizes in C and returns blank lines as empty rows
+        lines = csv_path.read_bytes().decode('utf-8-sig').splitlines()
+        reader = csv.reader(lines, skipinitialspace=True)
+        for row in reader:
+            line_num = reader.line_num
+
+            # Parse CSV row: email, segment, joining_date
+            parts = [p.strip() for p in row]
+            if not any(parts):
+                continue
+
+            if len(parts) != 3:
+                print(f"⚠️  Warning: Line {line_num} has {len(parts)} fields (expected 3), skipping")
+                continue
+
+            email, segment, joining_date_str = parts
+
+            # Parse date (format: MM/DD/YYYY) - split is much cheaper than strptime
+            try:
+                month, day, year = joining_date_str.split('/')
+                if len(year) != 4:
+                    raise ValueError(year)
+                joining_date = datetime(int(year), int(month), int(day))
+            except ValueError:
+                print(f"⚠️  Warning: Line {line_num} has invalid date format '{joining_date_str}', skipping")
+                continue
+
+            emails.append(email)
+            segments.append(segment)
+            joining_dates.append(joining_date.isoformat())
+
+        if not emails:
             print("⚠️  No valid sales rep data found in CSV")
             return
 
-        print(f"\n📊 Found {len(sales_reps)} sales reps")
+        print(f"\n📊 Found {len(emails)} sales reps")
 
         # Group by segment for summary
-        segments = {}
-        for rep in sales_reps:
-            seg = rep['segment']
-            segments[seg] = segments.get(seg, 0) + 1
-
-        for segment, count in sorted(segments.items()):
+        for segment, count in sorted(Counter(segments).items()):
             print(f"   • {segment}: {count} reps")
 
-        # Insert into database
+        # Upsert into database in a single transaction (created_at is kept on update)
         now = datetime.now().isoformat()
-        inserted = 0
-        updated = 0
-
-        for rep in sales_reps:
-            # Check if rep already exists
-            cursor = repo.conn.execute(
-                "SELECT email FROM sales_reps WHERE email = ?",
-                (rep['email'],)
-            )
-            exists = cursor.fetchone() is not None
+        existing = {row[0] for row in repo.conn.execute("SELECT email FROM sales_reps")}
 
-            # Insert or update
-            repo.conn.execute(
+        rows = [
+            (email, segment, joining_date, now, now)
+            for email, segment, joining_date in zip(emails, segments, joining_dates)
+        ]
+
+        with repo.conn:
+            repo.conn.executemany(
                 """
-                INSERT OR REPLACE INTO sales_reps (email, segment, joining_date, created_at, updated_at)
+                INSERT INTO sales_reps (email, segment, joining_date, created_at, updated_at)
                 VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(email) DO UPDATE SET
+                    segment = excluded.segment,
+                    joining_date = excluded.joining_date,
+                    updated_at = excluded.updated_at
                 """,
-                (
-                    rep['email'],
-                    rep['segment'],
-                    rep['joining_date'].isoformat(),
-                    now if not exists else repo.conn.execute(
-                        "SELECT created_at FROM sales_reps WHERE email = ?",
-                        (rep['email'],)
-                    ).fetchone()[0],
-                    now
-                )
+                rows,
             )
 
-            if exists:
-                updated += 1
-            else:
-                inserted += 1
-
-        repo.conn.commit()
+        unique_emails = set(emails)
+        updated = len(unique_emails & existing)
+        inserted = len(unique_emails - existing)
 
         print(f"\n✅ Success!")
         print(f"   • Inserted: {inserted} new reps")
@@ -126,4 +115,4 @@ async def load_sales_reps(csv_file: str = "sales_rep_data.csv"):
 
 
 if __name__ == "__main__":
-    asyncio.run(load_sales_reps())
+    _run(load_sales_reps())
@@ -6,8 +6,8 @@ Standalone script to post MEDDPICC summaries without running analysis.
 Useful for daily status updates or when you want to view historical data.
 """
 
-import asyncio
 import sys
+import traceback
 from pathlib import Path
 
 import click
@@ -15,8 +15,8 @@ import click
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.cli import _post_by_domain, _post_by_rep, _run
 from src.config import load_settings
-from src.models import CallAnalysis, Participants
 from src.slack_client import SlackClient
 from src.sqlite_repository import SQLiteCallRepository
 
@@ -76,11 +76,10 @@ def main(by_rep, by_domain):
 
     # Run async posting
     try:
-        asyncio.run(post_summaries(settings, by_rep, by_domain))
+        _run(post_summaries(settings, by_rep, by_domain))
         click.echo("\n✅ Done!")
     except Exception as e:
         click.echo(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -92,66 +91,27 @@ async def post_summaries(settings, by_rep: bool, by_domain: bool):
 
     try:
         # Check database
-        all_accounts = await repository.get_all_accounts()
+        num_accounts, total_calls = await repository.get_account_stats()
 
-        if not all_accounts:
+        if not num_accounts:
             click.echo("\n⚠️  No accounts found in database")
             click.echo("   Run the analyzer first to populate the database")
             return
 
-        # Count total calls
-        total_calls = sum(len(account.calls) for account in all_accounts)
-
         click.echo(f"\n📊 Database summary:")
-        click.echo(f"   • Accounts: {len(all_accounts)}")
+        click.echo(f"   • Accounts: {num_accounts}")
         click.echo(f"   • Discovery calls: {total_calls}")
 
         # Initialize Slack client
-        slack_client = SlackClient(settings.slack_bot_token, settings.slack_channel_id)
-
-        # Post call summary (by rep)
-        if by_rep:
-            click.echo(f"\n📤 Posting call summary table (by rep) in batches...")
-
-            # Build CallAnalysis objects from database
-            call_analyses = []
-            for account in all_accounts:
-                for call in account.calls:
-                    analysis = CallAnalysis(
-                        call_id=call.call_id,
-                        call_title=f"Discovery - {account.domain}",
-                        gong_link=f"https://app.gong.io/call?id={call.call_id}",
-                        call_date=call.call_date,
-                        sales_rep_email=call.sales_rep,
-                        participants=Participants(
-                            internal=[call.sales_rep],
-                            external=call.external_participants
-                        ),
-                        is_discovery_call=True,
-                        meddpicc_scores=call.meddpicc_scores,
-                        meddpicc_summary=call.meddpicc_summary or "",
-                        discovery_reasoning="From database",
-                    )
-                    call_analyses.append(analysis)
-
-            # Post in batches (batch_size defaults to 25, grouped by rep)
-            success = await slack_client.post_summary_table_batched(call_analyses)
-
-            if success:
-                click.echo(f"   ✅ Posted {len(call_analyses)} calls in batches (grouped by rep)")
-            else:
-                click.echo(f"   ❌ Failed to post call summary")
-
-        # Post account summary (by domain)
-        if by_domain:
-            click.echo(f"\n📤 Posting account summary table (by domain) in batches...")
-
-            success = await slack_client.post_account_summary_table_batched(all_accounts)
-
-            if success:
-                click.echo(f"   ✅ Posted {len(all_accounts)} accounts in batches")
-            else:
-                click.echo(f"   ❌ Failed to post account summary")
+        async with SlackClient(settings.slack_bot_token, settings.slack_channel_id) as slack_client:
+            # Both tables go to the same channel, and chat.postMessage is limited to
+            # ~1 message/sec per channel, so post them one after the other: running
+            # them concurrently would interleave the tables and trip rate limits
+            if by_rep:
+                await _post_by_rep(slack_client, repository, total_calls)
+
+            if by_domain:
+                await _post_by_domain(slack_client, repository)
 
     finally:
         await repository.close()
@@ -1,16 +1,18 @@
 """Main analyzer orchestrating the analysis workflow."""
 
-from datetime import datetime
+import asyncio
+import hashlib
+from collections import defaultdict
+from datetime import datetime, timezone
 from typing import Optional
 
 from .config import Settings
 from .gong_client import AsyncGongClient
-from .llm_client import LLMClient
-from .models import CallAnalysis
+from .llm_client import PROMPT_VERSION, LLMClient
+from .models import AnalysisNotes, CallAnalysis, MEDDPICCScores
 from .repository import CallRepository
 from .sqlite_repository import SQLiteCallRepository
 
-
 class CallAnalyzer:
     """Orchestrates the analysis workflow."""
 
@@ -35,22 +37,25 @@ class CallAnalyzer:
         """
         Analyze calls for specified sales reps.
 
-        If slack_client is provided, posts results as they complete (grouped by rep).
+        If slack_client is provided, posts results as each rep completes (grouped by rep).
 
         Args:
-            sales_rep_emails: List of sales rep email addresses (should be pre-sorted)
+            sales_rep_emails: List of sales rep email addresses (any order)
             verbose: Print progress information
 
         Returns:
             List of CallAnalysis results
         """
         results = []
+        failed_count = 0
 
         def log(msg: str):
             if verbose:
                 print(msg)
 
-        async with AsyncGongClient(self.settings) as gong_client:
+        async with AsyncGongClient(
+            self.settings, max_concurrency=self.settings.gong_concurrency
+        ) as gong_client:
             # Step 1: Fetch calls from Gong (already filtered for external participants)
             log(f"\n📞 Fetching calls with extended metadata (last {self.settings.gong_lookback_days} days)...")
             log(f"   • Sales reps: {', '.join(sales_rep_emails)}")
@@ -68,15 +73,18 @@ class CallAnalyzer:
                 log(f"\n   💡 Debug: Run 'python tests/test_gong.py --sales-reps-file sales_reps.txt' to verify Gong connection")
                 return results
 
-            # Group by rep for reporting
-            calls_by_rep = {}
+            # Group calls by rep once, for both reporting and ordered processing
+            calls_by_rep = defaultdict(list)
             for call in calls:
                 email = call.get("sales_rep_email", "Unknown")
-                calls_by_rep[email] = calls_by_rep.get(email, 0) + 1
+                # Normalize email: strip whitespace and lowercase
+                email = email.strip().lower() if email != "Unknown" else email
+                calls_by_rep[email].append(call)
+            sorted_reps = sorted(calls_by_rep)
 
             log(f"   ✓ Found {len(calls)} calls with external participants")
-            for email, count in sorted(calls_by_rep.items()):
-                log(f"     • {email}: {count} calls")
+            for email in sorted_reps:
+                log(f"     • {email}: {len(calls_by_rep[email])} calls")
 
             # Step 2: Extract call IDs for batch transcript fetch
             call_ids = []
@@ -91,33 +99,24 @@ class CallAnalyzer:
             transcripts = await gong_client.get_transcripts(call_ids)
             log(f"   ✓ Fetched {len(transcripts)} transcripts")
 
-            transcripts_by_rep = {}
-            for call in calls:
-                email = call.get("sales_rep_email", "Unknown")
-                call_id = call.get("metaData", {}).get("id")
-                if call_id and call_id in transcripts:
-                    transcripts_by_rep[email] = transcripts_by_rep.get(email, 0) + 1
+            for email in sorted_reps:
+                count = sum(1 for call in calls_by_rep[email] if call.get("metaData", {}).get("id") in transcripts)
+                if count:
+                    log(f"     • {email}: {count} transcripts")
 
-            for email, count in sorted(transcripts_by_rep.items()):
-                log(f"     • {email}: {count} transcripts")
+            # Look up already-evaluated calls in one query
+            existing_ids = (
+                await self.repository.get_existing_call_ids(call_ids) if self.repository else set()
+            )
 
-            # Step 4: Group calls by rep for ordered processing
-            calls_by_rep = {}
-            for call in calls:
-                email = call.get("sales_rep_email", "Unknown")
-                # Normalize email: strip whitespace and lowercase
-                email = email.strip().lower() if email != "Unknown" else email
-                if email not in calls_by_rep:
-                    calls_by_rep[email] = []
-                calls_by_rep[email].append(call)
-
-            # Step 5: Process each rep's calls in alphabetical order
+            # Step 4: Process each rep's calls in alphabetical order
             log(f"\n🤖 Analyzing calls with LLM (processing by rep)...")
             log(f"   Total unique reps: {len(calls_by_rep)}")
-            log(f"   Reps (sorted): {', '.join(sorted(calls_by_rep.keys()))}")
+            log(f"   Reps (sorted): {', '.join(sorted_reps)}")
 
+            llm_semaphore = asyncio.Semaphore(self.settings.llm_concurrency)
             total_processed = 0
-            for rep_email in sorted(calls_by_rep.keys()):
+            for rep_email in sorted_reps:
                 rep_calls = calls_by_rep[rep_email]
                 log(f"\n   Processing {rep_email} ({len(rep_calls)} calls)...")
 
@@ -128,12 +127,11 @@ class CallAnalyzer:
 
                 rep_discovery_count = 0
 
+                # Collect calls that still need LLM analysis
+                pending = []
                 for i, call in enumerate(rep_calls, 1):
                     total_processed += 1
-                    meta = call.get("metaData", {})
-                    call_id = meta.get("id")
-                    call_title = meta.get("title", "Untitled")
-                    sales_rep = call.get("sales_rep_email", "Unknown")
+                    call_id = call.get("metaData", {}).get("id")
 
                     if not call_id or call_id not in transcripts:
                         log(f"      [{i}/{len(rep_calls)}] Skipping {call_id} - no transcript")
@@ -141,22 +139,43 @@ class CallAnalyzer:
 
                     # Check if call already evaluated (skip LLM analysis)
                     if self.repository:
-                        if await self.repository.call_exists(call_id):
+                        if call_id in existing_ids:
                             log(f"      [{i}/{len(rep_calls)}] ⏭️  Skipping {call_id} - already evaluated")
                             continue
                     else:
                         log(f"      [{i}/{len(rep_calls)}] ⚠️  No repository - cannot check for duplicates")
 
-                    transcript = transcripts[call_id]
+                    pending.append((i, call))
+
+                # Run LLM classification/scoring for this rep's calls concurrently
+                if pending:
+                    log(f"      → Evaluating {len(pending)} call(s) with LLM "
+                        f"(up to {self.settings.llm_concurrency} concurrent)...")
+                # One failed call (API error, unparseable scores) must not sink the rest
+                evaluations = await asyncio.gather(*[
+                    self._evaluate_transcript(transcripts[call["metaData"]["id"]], llm_semaphore)
+                    for _, call in pending
+                ], return_exceptions=True)
+
+                # Store and post results sequentially to keep ordering in the Slack thread
+                calls_by_domain: dict[str, list[CallAnalysis]] = defaultdict(list)
+                evaluated: list[tuple[str, bool, str]] = []
+                for (i, call), evaluation in zip(pending, evaluations):
+                    meta = call.get("metaData", {})
+                    call_id = meta.get("id")
+                    call_title = meta.get("title", "Untitled")
 
                     log(f"      [{i}/{len(rep_calls)}] {call_title[:50]}...")
 
-                    # Classify if discovery call
-                    is_discovery, reasoning = await self.llm_client.is_discovery_call(transcript)
+                    # Left unmarked, so the next run evaluates it again
+                    if isinstance(evaluation, Exception):
+                        print(f"[ERROR] Failed to evaluate call {call_id}: {evaluation}")
+                        failed_count += 1
+                        continue
+                    is_discovery, reasoning, scored = evaluation
 
-                    # Store that we've evaluated this call (for deduplication)
-                    if self.repository:
-                        await self.repository.store_evaluated_call(call_id, is_discovery, reasoning)
+                    # Marked as evaluated (for deduplication) once its account is stored below
+                    evaluated.append((call_id, is_discovery, reasoning))
 
                     if not is_discovery:
                         log(f"         → ❌ Not discovery: {reasoning[:80]}...")
@@ -172,7 +191,7 @@ class CallAnalyzer:
                     call_date = (
                         datetime.fromisoformat(call_started.replace("Z", "+00:00"))
                         if call_started
-                        else datetime.now()
+                        else datetime.now(timezone.utc)
                     )
 
                     # Build base analysis
@@ -187,11 +206,10 @@ class CallAnalyzer:
                         discovery_reasoning=reasoning,
                     )
 
-                    # If discovery call, score MEDDPICC
+                    # If discovery call, attach MEDDPICC scores
                     if is_discovery:
+                        scores, notes, summary = scored
                         log(f"         → ✅ Discovery call!")
-                        log(f"         → Scoring MEDDPICC...")
-                        scores, notes, summary = await self.llm_client.score_meddpicc(transcript)
                         analysis.meddpicc_scores = scores
                         analysis.meddpicc_summary = summary
                         analysis.analysis_notes = notes
@@ -199,27 +217,36 @@ class CallAnalyzer:
 
                         rep_discovery_count += 1
 
-                        # Store in database if repository available
-                        if self.repository and participants.external:
-                            # Extract domain from first external participant
-                            first_external = participants.external[0]
-                            domain = first_external.split("@")[-1] if "@" in first_external else first_external
-                            log(f"         → Storing to database (domain: {domain})...")
-                            account_record = await self.repository.add_discovery_call(domain, analysis)
-                            log(f"         → Account now has {len(account_record.calls)} discovery call(s)")
-                            log(f"         → Account overall score: {account_record.overall_meddpicc.overall_score}/5.0")
-
-                        # Post to Slack immediately
+                        # Queue for the database; each account is written once per rep
+                        if self.repository and participants.primary_external_domain:
+                            calls_by_domain[participants.primary_external_domain].append(analysis)
+
+                        # Queue for Slack (posted in one batch per rep)
                         if self.slack_client:
-                            log(f"         → Posting to Slack...")
-                            await self.slack_client.post_call_eval(analysis)
+                            self.slack_client.queue_call_eval(analysis)
                     else:
                         log(f"         → ❌ Not discovery")
 
                     results.append(analysis)
 
-                # Post completion summary for this rep
+                # Store this rep's discovery calls, one write per account
+                for domain, domain_calls in calls_by_domain.items():
+                    log(f"   → Storing {len(domain_calls)} discovery call(s) to database (domain: {domain})...")
+                    account_record = await self.repository.add_discovery_calls(domain, domain_calls)
+                    log(f"      → Account now has {len(account_record.calls)} discovery call(s)")
+                    log(f"      → Account overall score: {account_record.overall_meddpicc.overall_score}/5.0")
+
+                # Only now mark the calls evaluated: a crash before this point
+                # leaves them unmarked, so the next run re-evaluates them
+                if self.repository:
+                    for call_id, is_discovery, reasoning in evaluated:
+                        await self.repository.store_evaluated_call(call_id, is_discovery, reasoning)
+
+                # Post this rep's call evals, then the completion summary
                 if self.slack_client:
+                    if rep_discovery_count:
+                        log(f"   → Posting {rep_discovery_count} call eval(s) to Slack for {rep_email}...")
+                        await self.slack_client.flush_rep(rep_email)
                     log(f"   → Posting completion summary for {rep_email}...")
                     await self.slack_client.post_rep_completion_summary(
                         rep_email, rep_discovery_count, len(rep_calls)
@@ -229,6 +256,13 @@ class CallAnalyzer:
             log(f"\n✓ Analysis complete:")
             log(f"   • Total external calls: {len(results)}")
             log(f"   • Discovery calls: {discovery_count}")
+            if failed_count:
+                log(f"   • Failed (retried next run): {failed_count}")
+            usage = self.llm_client.usage
+            if usage:
+                log(f"   • LLM input tokens: {usage['input_tokens']:,} uncached, "
+                    f"{usage['cache_read_input_tokens']:,} from prompt cache, "
+                    f"{usage['cache_creation_input_tokens']:,} written to cache")
 
             # Debug: Check conditions for summary tables
             log(f"\n🔍 Summary table conditions:")
@@ -255,20 +289,16 @@ class CallAnalyzer:
                     # Collect unique domains from discovery calls
                     domains = set()
                     for r in results:
-                        if r.is_discovery_call and r.participants.external:
-                            first_external = r.participants.external[0]
-                            domain = first_external.split("@")[-1] if "@" in first_external else first_external
-                            domains.add(domain)
+                        if r.is_discovery_call and r.participants.primary_external_domain:
+                            domains.add(r.participants.primary_external_domain)
 
                     log(f"   → Found {len(domains)} unique domain(s)")
 
-                    # Get account records for these domains
-                    account_records = []
-                    for domain in domains:
-                        account = await self.repository.get_account(domain)
-                        if account:
-                            account_records.append(account)
-                            log(f"      • {domain}: {len(account.calls)} call(s)")
+                    # Get account records for these domains in one query
+                    accounts = await self.repository.get_accounts(list(domains))
+                    account_records = list(accounts.values())
+                    for account in account_records:
+                        log(f"      • {account.domain}: {len(account.calls)} call(s)")
 
                     if account_records:
                         try:
@@ -284,7 +314,78 @@ class CallAnalyzer:
 
         return results
 
+    async def _evaluate_transcript(
+        self, transcript: str, semaphore: asyncio.Semaphore
+    ) -> tuple[bool, str, Optional[tuple[MEDDPICCScores, AnalysisNotes, str]]]:
+        """
+        Classify a transcript and, if it is a discovery call, score MEDDPICC.
+
+        Results are cached in the repository by a hash of the model, prompt
+        version and transcript, so an identical transcript never goes to the
+        same prompt twice. Speaker tags are part of the key, since who asked
+        and who answered changes both the classification and the scores.
+
+        Args:
+            transcript: The call transcript text
+            semaphore: Bounds the number of in-flight LLM requests
+
+        Returns:
+            Tuple of (is_discovery, reasoning, (scores, notes, summary) or None)
+        """
+        # Key on model and prompt version too, so changing either re-evaluates
+        transcript_hash = hashlib.blake2b(
+            f"{self.llm_client.model}|v{PROMPT_VERSION}|{transcript}".encode(), digest_size=16
+        ).hexdigest()
+        discovery_key = f"discovery:{transcript_hash}"
+        meddpicc_key = f"meddpicc:{transcript_hash}"
+
+        async with semaphore:
+            cached = await self._get_cached(discovery_key, meddpicc_key)
+            if cached:
+                return cached
+
+            # One LLM round-trip classifies and, for discovery calls, scores
+            is_discovery, reasoning, scored = await self.llm_client.analyze(transcript)
+
+        if self.repository:
+            # Don't cache fallbacks from unparseable responses
+            if not reasoning.startswith("Parse error"):
+                await self.repository.store_llm_cache(
+                    discovery_key, {"is_discovery_call": is_discovery, "reasoning": reasoning}
+                )
+            if scored:
+                scores, notes, summary = scored
+                await self.repository.store_llm_cache(
+                    meddpicc_key,
+                    {"scores": scores.model_dump(), "notes": notes.model_dump(), "summary": summary},
+                )
+        return is_discovery, reasoning, scored
+
+    async def _get_cached(
+        self, discovery_key: str, meddpicc_key: str
+    ) -> Optional[tuple[bool, str, Optional[tuple[MEDDPICCScores, AnalysisNotes, str]]]]:
+        """Return a complete cached evaluation, or None if the LLM must be called."""
+        if not self.repository:
+            return None
+
+        classified = await self.repository.get_llm_cache(discovery_key)
+        if not classified:
+            return None
+        is_discovery, reasoning = classified["is_discovery_call"], classified["reasoning"]
+        if not is_discovery:
+            return False, reasoning, None
+
+        cached = await self.repository.get_llm_cache(meddpicc_key)
+        if not cached:
+            return None
+        return True, reasoning, (
+            MEDDPICCScores(**cached["scores"]),
+            AnalysisNotes(**cached["notes"]),
+            cached["summary"],
+        )
+
     async def close(self) -> None:
         """Close any open connections."""
+        await LLMClient.aclose()
         if self.repository:
             await self.repository.close()
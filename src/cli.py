@@ -4,19 +4,28 @@ Introspect CLI - Command-line interface for the tool.
 """
 
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
 import subprocess
 import sys
+import traceback
 from pathlib import Path
+from typing import AsyncIterator, Optional
 
 import click
 
 from src.analyzer import CallAnalyzer
 from src.config import load_settings
-from src.formatters import format_console_output
+from src.formatters import format_console_output, prepare
 from src.models import CallAnalysis, Participants
 from src.slack_client import SlackClient
 from src.sqlite_repository import SQLiteCallRepository
 
+# Started once per process by _configure_logging
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 
 @click.group()
 @click.version_option(version="1.0.0", prog_name="introspect")
@@ -26,7 +35,42 @@ def cli():
 
     Analyze sales discovery calls and track MEDDPICC qualification.
     """
-    pass
+    _configure_logging()
+
+
+def _configure_logging():
+    """
+    Send log records through a queue to a background thread writing to stderr.
+
+    Concurrent LLM tasks then only enqueue their warnings instead of
+    blocking the event loop on terminal writes. Safe to call on every
+    command invocation: only the first call installs the handler.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+def _run(coro):
+    """Run a command's coroutine on uvloop when available (not supported on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def _load_emails(path: Path) -> list[str]:
+    """Read one email per line, skipping blank lines."""
+    return [line for line in map(str.strip, path.read_text().splitlines()) if line]
 
 
 @cli.command()
@@ -68,59 +112,56 @@ def analyze(days, reps, reps_file, post_slack):
         introspect analyze --days 30 --reps-file sales_reps.txt
         introspect analyze --post-slack
     """
+    # Load settings first: a misconfigured .env is the likeliest failure, so
+    # report it before reading any rep files
+    try:
+        # Override lookback days with CLI parameter (copy: settings are cached and shared)
+        settings = load_settings().model_copy(update={"gong_lookback_days": days})
+    except Exception as e:
+        click.echo(f"\n❌ Error loading settings: {e}", err=True)
+        click.echo("\nMake sure .env file is configured correctly.")
+        sys.exit(1)
+
     # Collect email addresses
     emails = list(reps)
 
     if reps_file:
-        with open(reps_file) as f:
-            file_emails = [line.strip() for line in f if line.strip()]
-            emails.extend(file_emails)
+        emails.extend(_load_emails(Path(reps_file)))
 
     # Default to sales_reps.txt if no reps specified
     if not emails:
         default_file = Path("sales_reps.txt")
         if default_file.exists():
-            with open(default_file) as f:
-                emails = [line.strip() for line in f if line.strip()]
+            emails = _load_emails(default_file)
             click.echo(f"📋 Using sales reps from sales_reps.txt")
         else:
             click.echo("Error: No sales rep emails provided.", err=True)
             click.echo("Use -r or --reps-file to specify email addresses, or create sales_reps.txt")
             sys.exit(1)
 
-    # Sort emails alphabetically for consistent processing order
-    emails = sorted(set(emails))  # Remove duplicates and sort
+    # Remove duplicates, keeping first-seen order (analyzer sorts reps itself)
+    emails = list(dict.fromkeys(e.strip() for e in emails if e.strip()))
 
     click.echo("\n" + "=" * 70)
     click.echo("Introspect - Gong Transcript MEDDPICC Analysis")
     click.echo("=" * 70)
-    click.echo(f"\n📧 Sales reps: {', '.join(emails)}")
+    click.echo(f"\n📧 Sales reps: {', '.join(sorted(emails))}")
     click.echo(f"📅 Lookback: {days} days")
 
-    try:
-        settings = load_settings()
-        # Override lookback days with CLI parameter
-        settings.gong_lookback_days = days
-
-        click.echo(f"⚙️  Configuration loaded")
-        click.echo(f"   • Gong API: {settings.gong_api_url}")
-        click.echo(f"   • LLM Model: {settings.llm_model}")
-    except Exception as e:
-        click.echo(f"\n❌ Error loading settings: {e}", err=True)
-        click.echo("\nMake sure .env file is configured correctly.")
-        sys.exit(1)
+    click.echo(f"⚙️  Configuration loaded")
+    click.echo(f"   • Gong API: {settings.gong_api_url}")
+    click.echo(f"   • LLM Model: {settings.llm_model}")
 
     # Run async analysis
     try:
-        results = asyncio.run(run_analysis(settings, emails, post_slack))
+        results = _run(run_analysis(settings, emails, post_slack))
     except Exception as e:
         click.echo(f"\n❌ Error during analysis: {e}", err=True)
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
     # Display console output
-    console_output = format_console_output(results)
+    console_output = format_console_output(prepare(results))
     click.echo(console_output)
 
 
@@ -149,6 +190,8 @@ async def run_analysis(settings, emails, post_slack):
     finally:
         # Always close repository connection
         await analyzer.close()
+        if slack_client:
+            await slack_client.aclose()
 
 
 @cli.command()
@@ -164,7 +207,12 @@ async def run_analysis(settings, emails, post_slack):
     is_flag=True,
     help="Post sales rep summaries (grouped by rep)",
 )
-def post(accounts, reps):
+@click.option(
+    "--explain",
+    is_flag=True,
+    help="Print SQLite query plans for the database reads and exit (nothing is posted)",
+)
+def post(accounts, reps, explain):
     """
     Post MEDDPICC summary tables to Slack from database.
 
@@ -178,6 +226,7 @@ def post(accounts, reps):
         introspect post -a           # Post only account summaries
         introspect post -r           # Post only rep summaries
         introspect post -a -r        # Post both summaries
+        introspect post --explain    # Audit database query plans
     """
     # Default to both if neither specified
     if not accounts and not reps:
@@ -191,30 +240,81 @@ def post(accounts, reps):
     try:
         settings = load_settings()
 
-        if not settings.slack_bot_token or not settings.slack_channel_id:
+        # The query plan audit only reads the database, so it doesn't need Slack
+        if not explain and (not settings.slack_bot_token or not settings.slack_channel_id):
             click.echo("\n❌ Error: Slack not configured")
             click.echo("   Add SLACK_BOT_TOKEN and SLACK_CHANNEL_ID to .env")
             sys.exit(1)
 
         click.echo(f"\n✓ Configuration loaded")
         click.echo(f"  • Database: {settings.sqlite_db_path}")
-        click.echo(f"  • Slack Channel: {settings.slack_channel_id}")
+        if not explain:
+            click.echo(f"  • Slack Channel: {settings.slack_channel_id}")
 
     except Exception as e:
         click.echo(f"\n❌ Error loading settings: {e}")
         sys.exit(1)
 
+    if explain:
+        try:
+            _run(explain_queries(settings))
+        except Exception as e:
+            click.echo(f"\n❌ Error explaining query plans: {e}")
+            sys.exit(1)
+        return
+
     # Run async posting
     try:
-        asyncio.run(post_summaries(settings, reps, accounts))
+        _run(post_summaries(settings, reps, accounts))
         click.echo("\n✅ Done!")
     except Exception as e:
         click.echo(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
+async def explain_queries(settings):
+    """Print the SQLite query plan for each hot repository query."""
+    # Opening the repository creates a missing database; an audit must not write one
+    if not Path(settings.sqlite_db_path).is_file():
+        raise FileNotFoundError(f"Database not found: {settings.sqlite_db_path}")
+    repository = SQLiteCallRepository(settings.sqlite_db_path)
+
+    try:
+        plans = await repository.explain_query_plans()
+    finally:
+        await repository.close()
+
+    click.echo(f"\n🔍 Query plans for {settings.sqlite_db_path}:")
+    for name, steps in plans.items():
+        click.echo(f"\n   {name}")
+        for step in steps:
+            # Full-table scans and temp sorts mean a read isn't served by an index
+            unindexed = (step.startswith("SCAN") and "INDEX" not in step) or "TEMP B-TREE" in step
+            flag = "⚠️ " if unindexed else "✓ "
+            click.echo(f"     {flag}{step}")
+
+
+async def iter_call_analyses(repository) -> AsyncIterator[CallAnalysis]:
+    """Yield a CallAnalysis for each discovery call stored in the database."""
+    async for domain, call in repository.iter_account_calls():
+        yield CallAnalysis(
+            call_id=call.call_id,
+            call_title=f"Discovery - {domain}",
+            gong_link=f"https://app.gong.io/call?id={call.call_id}",
+            call_date=call.call_date,
+            sales_rep_email=call.sales_rep,
+            participants=Participants(
+                internal=[call.sales_rep],
+                external=call.external_participants
+            ),
+            is_discovery_call=True,
+            meddpicc_scores=call.meddpicc_scores,
+            meddpicc_summary=call.meddpicc_summary or "",
+            discovery_reasoning="From database",
+        )
+
+
 async def post_summaries(settings, by_rep: bool, by_domain: bool):
     """Post summary tables to Slack."""
     # Initialize repository
@@ -222,71 +322,60 @@ async def post_summaries(settings, by_rep: bool, by_domain: bool):
 
     try:
         # Check database
-        all_accounts = await repository.get_all_accounts()
+        num_accounts, total_calls = await repository.get_account_stats()
 
-        if not all_accounts:
+        if not num_accounts:
             click.echo("\n⚠️  No accounts found in database")
             click.echo("   Run 'introspect analyze' first to populate the database")
             return
 
-        # Count total calls
-        total_calls = sum(len(account.calls) for account in all_accounts)
-
         click.echo(f"\n📊 Database summary:")
-        click.echo(f"   • Accounts: {len(all_accounts)}")
+        click.echo(f"   • Accounts: {num_accounts}")
         click.echo(f"   • Discovery calls: {total_calls}")
 
         # Initialize Slack client
-        slack_client = SlackClient(settings.slack_bot_token, settings.slack_channel_id)
-
-        # Post call summary (by rep)
-        if by_rep:
-            click.echo(f"\n📤 Posting call summary table (by rep) in batches...")
-
-            # Build CallAnalysis objects from database
-            call_analyses = []
-            for account in all_accounts:
-                for call in account.calls:
-                    analysis = CallAnalysis(
-                        call_id=call.call_id,
-                        call_title=f"Discovery - {account.domain}",
-                        gong_link=f"https://app.gong.io/call?id={call.call_id}",
-                        call_date=call.call_date,
-                        sales_rep_email=call.sales_rep,
-                        participants=Participants(
-                            internal=[call.sales_rep],
-                            external=call.external_participants
-                        ),
-                        is_discovery_call=True,
-                        meddpicc_scores=call.meddpicc_scores,
-                        meddpicc_summary=call.meddpicc_summary or "",
-                        discovery_reasoning="From database",
-                    )
-                    call_analyses.append(analysis)
-
-            # Post in batches (batch_size defaults to 25, grouped by rep)
-            success = await slack_client.post_summary_table_batched(call_analyses)
-
-            if success:
-                click.echo(f"   ✅ Posted {len(call_analyses)} calls in batches (grouped by rep)")
-            else:
-                click.echo(f"   ❌ Failed to post call summary")
-
-        # Post account summary (by domain)
-        if by_domain:
-            click.echo(f"\n📤 Posting account summary table (by domain) in batches...")
-
-            success = await slack_client.post_account_summary_table_batched(all_accounts)
-
-            if success:
-                click.echo(f"   ✅ Posted {len(all_accounts)} accounts in batches")
-            else:
-                click.echo(f"   ❌ Failed to post account summary")
+        async with SlackClient(settings.slack_bot_token, settings.slack_channel_id) as slack_client:
+            # Both tables go to the same channel, and chat.postMessage is limited to
+            # ~1 message/sec per channel, so post them one after the other: running
+            # them concurrently would interleave the tables and trip rate limits
+            if by_rep:
+                await _post_by_rep(slack_client, repository, total_calls)
+
+            if by_domain:
+                await _post_by_domain(slack_client, repository)
 
     finally:
         await repository.close()
 
 
+async def _post_by_rep(slack_client: SlackClient, repository, total_calls: int):
+    """Post call summary table (grouped by rep)."""
+    click.echo(f"\n📤 Posting call summary table (by rep) in batches...")
+
+    # Post in batches (batch_size defaults to 25, grouped by rep)
+    success = await slack_client.post_summary_table_batched(
+        iter_call_analyses(repository)
+    )
+
+    if success:
+        click.echo(f"   ✅ Posted {total_calls} calls in batches (grouped by rep)")
+    else:
+        click.echo(f"   ❌ Failed to post call summary")
+
+
+async def _post_by_domain(slack_client: SlackClient, repository):
+    """Post account summary table (grouped by domain)."""
+    click.echo(f"\n📤 Posting account summary table (by domain) in batches...")
+
+    all_accounts = await repository.get_all_accounts()
+    success = await slack_client.post_account_summary_table_batched(all_accounts)
+
+    if success:
+        click.echo(f"   ✅ Posted {len(all_accounts)} accounts in batches")
+    else:
+        click.echo(f"   ❌ Failed to post account summary")
+
+
 @cli.command()
 @click.option(
     "--port",
@@ -330,19 +419,31 @@ def ui(port, host):
     click.echo(f"   • Path: {streamlit_app_path}")
     click.echo("\n💡 Press Ctrl+C to stop the server\n")
 
-    # Launch streamlit
+    streamlit_args = [
+        "run",
+        str(streamlit_app_path),
+        "--server.port", str(port),
+        "--server.address", host,
+        "--server.headless", "true",
+    ]
+
+    # Run Streamlit in-process when importable (no PATH lookup or second interpreter)
     try:
-        subprocess.run(
-            [
-                "streamlit",
-                "run",
-                str(streamlit_app_path),
-                "--server.port", str(port),
-                "--server.address", host,
-                "--server.headless", "true",
-            ],
-            check=True
-        )
+        from streamlit.web import cli as streamlit_cli
+    except ImportError:
+        streamlit_cli = None
+
+    if streamlit_cli is not None:
+        sys.argv = ["streamlit", *streamlit_args]
+        try:
+            sys.exit(streamlit_cli.main())
+        except KeyboardInterrupt:
+            click.echo("\n\n👋 Shutting down UI...")
+        return
+
+    # Fall back to a streamlit executable on PATH (e.g. installed in another environment)
+    try:
+        subprocess.run(["streamlit", *streamlit_args], check=True)
     except subprocess.CalledProcessError as e:
         click.echo(f"\n❌ Error launching Streamlit: {e}", err=True)
         sys.exit(1)
@@ -1,28 +1,40 @@
 """Configuration management for the application."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
 from pydantic import field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
     # Gong API settings
     gong_api_url: str = "https://api.gong.io/v2"
     gong_access_key: str
     gong_secret_key: str
     gong_lookback_days: int = 7
     internal_domain: str  # e.g., "company.com" for external party detection
+    gong_concurrency: int = 8  # Max in-flight transcript batch requests
 
     # LLM settings
     llm_provider: str = "anthropic"
     llm_api_key: str
     llm_model: str = "claude-haiku-4-5-20251001"  # Haiku for cost optimization
+    llm_concurrency: int = 8  # Max in-flight LLM requests per rep
+    llm_rpm: int = 0  # Requests per minute to pace LLM calls to (0 = no limit)
+    llm_tpm: int = 0  # Input tokens per minute to pace LLM calls to (0 = no limit)
 
     # Slack settings
     slack_webhook_url: Optional[str] = None  # Deprecated - use slack_bot_token for threading
@@ -43,14 +55,9 @@ class Settings(BaseSettings):
         expanded = os.path.expandvars(expanded)
         return expanded
 
-    class Config:
-        """Pydantic config."""
-
-        env_file = ".env"
-        case_sensitive = False
-
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load and return application settings."""
+    """Load and return application settings (parsed once per process)."""
     load_dotenv()
     return Settings()
@@ -1,64 +1,144 @@
 """Output formatters for analysis results."""
 
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import List
 
-from .models import CallAnalysis
+from .models import MEDDPICC_DIMENSIONS, CallAnalysis, MEDDPICCScores
 
+_MEDDPICC_FIELDS = attrgetter(*MEDDPICC_DIMENSIONS)
+_MEDDPICC_TEMPLATE = "M:{} E:{} D:{} D:{} P:{} I:{} C:{} C:{}"
 
-def format_console_output(results: List[CallAnalysis]) -> str:
+# Constant Slack blocks, shared by every report (never mutated)
+_DIVIDER = {"type": "divider"}
+_REPORT_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "📊 Discovery Call Analysis Report",
+    },
+}
+
+
+def _meddpicc_line(scores: MEDDPICCScores) -> str:
+    """Render the per-dimension MEDDPICC breakdown (e.g. "M:3 E:1 ... C:2")."""
+    return _MEDDPICC_TEMPLATE.format(*_MEDDPICC_FIELDS(scores))
+
+
+def _rep_blocks(email: str, rep_results: List[CallAnalysis]) -> list[dict]:
+    """Build the Slack blocks for one rep: divider, rep header, one section per discovery call."""
+    return [
+        _DIVIDER,
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"*👤 {email}*"},
+        },
+        *[
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": (
+                        f"✅ *Discovery Call* | Score: *{result.meddpicc_scores.overall_score}/5.0*\n"
+                        f"📅 {result.call_date.strftime('%Y-%m-%d')} | <{result.gong_link}|View in Gong>\n"
+                        f"```MEDDPICC: {_meddpicc_line(result.meddpicc_scores)}```"
+                    ),
+                },
+            }
+            for result in rep_results
+            if result.is_discovery_call and result.meddpicc_scores
+        ],
+    ]
+
+
+@dataclass
+class PreparedResults:
+    """Analysis results grouped by rep, with the stats every formatter reports."""
+
+    by_rep: dict[str, list[CallAnalysis]]  # Ordered by rep email
+    discovery_by_rep: dict[str, int]
+    total_calls: int
+    discovery_calls: int
+    score_sum: float
+
+
+def prepare(results: List[CallAnalysis]) -> PreparedResults:
     """
-    Format analysis results for console output.
+    Group results by sales rep and tally stats in a single pass.
+
+    Compute this once and pass it to each formatter that needs it.
 
     Args:
         results: List of CallAnalysis objects
 
+    Returns:
+        PreparedResults for format_console_output / format_slack_output
+    """
+    by_rep: defaultdict[str, list[CallAnalysis]] = defaultdict(list)
+    discovery_by_rep: defaultdict[str, int] = defaultdict(int)
+    discovery_calls = 0
+    score_sum = 0.0
+    for result in results:
+        by_rep[result.sales_rep_email].append(result)
+        if result.is_discovery_call:
+            discovery_calls += 1
+            discovery_by_rep[result.sales_rep_email] += 1
+            scores = result.meddpicc_scores
+            if scores:
+                score_sum += scores.overall_score
+
+    return PreparedResults(
+        by_rep={email: by_rep[email] for email in sorted(by_rep)},
+        discovery_by_rep=dict(discovery_by_rep),
+        total_calls=len(results),
+        discovery_calls=discovery_calls,
+        score_sum=score_sum,
+    )
+
+
+def format_console_output(prepared: PreparedResults) -> str:
+    """
+    Format analysis results for console output.
+
+    Args:
+        prepared: Results grouped by prepare()
+
     Returns:
         Formatted string for console display
     """
-    if not results:
+    if not prepared.total_calls:
         return "No calls to analyze."
 
-    # Group by sales rep
-    by_rep = {}
-    for result in results:
-        email = result.sales_rep_email
-        if email not in by_rep:
-            by_rep[email] = []
-        by_rep[email].append(result)
-
-    output = []
-    output.append("\n" + "=" * 70)
-    output.append("DISCOVERY CALL ANALYSIS RESULTS")
-    output.append("=" * 70)
+    output: list[str] = []
+    add = output.append  # Bound once; called for every line below
+    add("\n" + "=" * 70)
+    add("DISCOVERY CALL ANALYSIS RESULTS")
+    add("=" * 70)
 
     # Stats
-    total_calls = len(results)
-    discovery_calls = sum(1 for r in results if r.is_discovery_call)
-    output.append(f"\n📊 Summary:")
-    output.append(f"  • Total calls analyzed: {total_calls}")
-    output.append(f"  • Discovery calls: {discovery_calls}")
-    output.append(f"  • Non-discovery calls: {total_calls - discovery_calls}")
+    total_calls = prepared.total_calls
+    discovery_calls = prepared.discovery_calls
+    add(f"\n📊 Summary:")
+    add(f"  • Total calls analyzed: {total_calls}")
+    add(f"  • Discovery calls: {discovery_calls}")
+    add(f"  • Non-discovery calls: {total_calls - discovery_calls}")
 
     if discovery_calls > 0:
-        avg_score = sum(
-            r.meddpicc_scores.overall_score
-            for r in results
-            if r.is_discovery_call and r.meddpicc_scores
-        ) / discovery_calls
-        output.append(f"  • Average MEDDPICC score: {avg_score:.1f}/5.0")
+        avg_score = prepared.score_sum / discovery_calls
+        add(f"  • Average MEDDPICC score: {avg_score:.1f}/5.0")
 
     # Results by rep
-    output.append("\n" + "=" * 70)
-    output.append("RESULTS BY SALES REP")
-    output.append("=" * 70)
+    add("\n" + "=" * 70)
+    add("RESULTS BY SALES REP")
+    add("=" * 70)
 
-    for email, rep_results in sorted(by_rep.items()):
-        output.append(f"\n👤 {email}")
-        output.append("   " + "-" * 66)
+    for email, rep_results in prepared.by_rep.items():
+        add(f"\n👤 {email}")
+        add("   " + "-" * 66)
 
-        rep_discovery = sum(1 for r in rep_results if r.is_discovery_call)
-        output.append(
-            f"   Calls: {len(rep_results)} total | {rep_discovery} discovery"
+        add(
+            f"   Calls: {len(rep_results)} total | {prepared.discovery_by_rep.get(email, 0)} discovery"
         )
 
         for result in rep_results:
@@ -67,46 +147,40 @@ def format_console_output(results: List[CallAnalysis]) -> str:
 
             if result.is_discovery_call and result.meddpicc_scores:
                 score = result.meddpicc_scores.overall_score
-                output.append(f"\n   ✅ {call_title}")
-                output.append(f"     Discovery Call | Score: {score}/5.0")
-                output.append(f"     📅 {call_date}")
-                output.append(f"     🔗 {result.gong_link}")
+                add(f"\n   ✅ {call_title}")
+                add(f"     Discovery Call | Score: {score}/5.0")
+                add(f"     📅 {call_date}")
+                add(f"     🔗 {result.gong_link}")
 
                 # MEDDPICC breakdown
-                s = result.meddpicc_scores
-                output.append(
-                    f"     📊 MEDDPICC: M:{s.metrics} E:{s.economic_buyer} "
-                    f"D:{s.decision_criteria} D:{s.decision_process} "
-                    f"P:{s.paper_process} I:{s.identify_pain} "
-                    f"C:{s.champion} C:{s.competition}"
-                )
+                add(f"     📊 MEDDPICC: {_meddpicc_line(result.meddpicc_scores)}")
 
                 # Summary
                 if result.meddpicc_summary:
-                    output.append(f"     💡 {result.meddpicc_summary}")
+                    add(f"     💡 {result.meddpicc_summary}")
             else:
-                output.append(f"\n   ❌ {call_title}")
-                output.append(f"     Not a Discovery Call")
-                output.append(f"     📅 {call_date}")
-                output.append(f"     🔗 {result.gong_link}")
+                add(f"\n   ❌ {call_title}")
+                add(f"     Not a Discovery Call")
+                add(f"     📅 {call_date}")
+                add(f"     🔗 {result.gong_link}")
                 if result.discovery_reasoning:
-                    output.append(f"     💬 Reason: {result.discovery_reasoning}")
+                    add(f"     💬 Reason: {result.discovery_reasoning}")
 
-    output.append("\n" + "=" * 70)
+    add("\n" + "=" * 70)
     return "\n".join(output)
 
 
-def format_slack_output(results: List[CallAnalysis]) -> dict:
+def format_slack_output(prepared: PreparedResults) -> dict:
     """
     Format analysis results for Slack Block Kit.
 
     Args:
-        results: List of CallAnalysis objects
+        prepared: Results grouped by prepare()
 
     Returns:
         Slack Block Kit formatted message
     """
-    if not results:
+    if not prepared.total_calls:
         return {
             "text": "No calls to analyze",
             "blocks": [
@@ -121,18 +195,12 @@ def format_slack_output(results: List[CallAnalysis]) -> dict:
         }
 
     # Stats
-    total_calls = len(results)
-    discovery_calls = sum(1 for r in results if r.is_discovery_call)
+    total_calls = prepared.total_calls
+    discovery_calls = prepared.discovery_calls
 
     blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": "📊 Discovery Call Analysis Report",
-            },
-        },
-        {"type": "divider"},
+        _REPORT_HEADER,
+        _DIVIDER,
         {
             "type": "section",
             "fields": [
@@ -141,15 +209,12 @@ def format_slack_output(results: List[CallAnalysis]) -> dict:
             ],
         },
     ]
+    add_block = blocks.append
 
     if discovery_calls > 0:
-        avg_score = sum(
-            r.meddpicc_scores.overall_score
-            for r in results
-            if r.is_discovery_call and r.meddpicc_scores
-        ) / discovery_calls
+        avg_score = prepared.score_sum / discovery_calls
 
-        blocks.append(
+        add_block(
             {
                 "type": "section",
                 "text": {
@@ -159,45 +224,8 @@ def format_slack_output(results: List[CallAnalysis]) -> dict:
             }
         )
 
-    # Group by rep
-    by_rep = {}
-    for result in results:
-        email = result.sales_rep_email
-        if email not in by_rep:
-            by_rep[email] = []
-        by_rep[email].append(result)
-
     # Add each rep's results
-    for email, rep_results in sorted(by_rep.items()):
-        blocks.append({"type": "divider"})
-        blocks.append(
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*👤 {email}*"},
-            }
-        )
-
-        for result in rep_results:
-            if result.is_discovery_call and result.meddpicc_scores:
-                score = result.meddpicc_scores.overall_score
-                date = result.call_date.strftime("%Y-%m-%d")
-                s = result.meddpicc_scores
-
-                blocks.append(
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": (
-                                f"✅ *Discovery Call* | Score: *{score}/5.0*\n"
-                                f"📅 {date} | <{result.gong_link}|View in Gong>\n"
-                                f"```MEDDPICC: M:{s.metrics} E:{s.economic_buyer} "
-                                f"D:{s.decision_criteria} D:{s.decision_process} "
-                                f"P:{s.paper_process} I:{s.identify_pain} "
-                                f"C:{s.champion} C:{s.competition}```"
-                            ),
-                        },
-                    }
-                )
+    for email, rep_results in prepared.by_rep.items():
+        blocks.extend(_rep_blocks(email, rep_results))
 
     return {"text": f"Discovery Call Analysis: {discovery_calls}/{total_calls} calls", "blocks": blocks}
@@ -1,15 +1,35 @@
 """Gong API client for fetching call transcripts."""
 
-import json
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
-from urllib.parse import urljoin
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
 
 import httpx
+import orjson
 
 from .config import Settings
+from .http_retry import RetryTransport
 from .models import Participants
 
+logger = logging.getLogger(__name__)
+
+# How long the on-disk user list is reused across process runs
+USER_CACHE_TTL_SECONDS = 86400.0
+# Minimum age of the on-disk user list before an unknown email triggers a refetch
+USER_CACHE_REFETCH_AFTER_SECONDS = 3600.0
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory (XDG_CACHE_HOME, else ~/.cache) for introspect."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "introspect"
+
 
 class GongAPIError(RuntimeError):
     """Raised for non-retryable HTTP errors from Gong API."""
@@ -20,7 +40,8 @@ class AsyncGongClient:
     Async Gong API client using httpx.
     - Auth: Basic (Access Key / Secret)
     - Pagination: auto-follow cursor
-    - Retries: 429 & 5xx with exponential backoff
+    - Retries: 429 & 5xx with jittered exponential backoff (honors Retry-After)
+    - Connections: one pooled HTTP/2 client shared by all requests
     """
 
     def __init__(
@@ -31,6 +52,7 @@ class AsyncGongClient:
         max_retries: int = 5,
         backoff_factor: float = 0.8,
         default_limit: int = 200,
+        max_concurrency: int = 8,
     ) -> None:
         """Initialize the async Gong client."""
         api_endpoint = settings.gong_api_url
@@ -40,13 +62,43 @@ class AsyncGongClient:
         self.base_url = api_endpoint.rstrip("/") + "/"
         self.lookback_days = settings.gong_lookback_days
         self.internal_domain = settings.internal_domain
+        self._internal_domain_lc = (settings.internal_domain or "").lower()
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.default_limit = default_limit
+        self.max_concurrency = max_concurrency
+
+        # Normalized email -> user ID, built from list_users once per client
+        self._email_index: Optional[dict[str, str]] = None
+        # When the last list_users result was fetched from Gong (the file mtime for the disk copy)
+        self._users_fetched_at = 0.0
+
+        # On-disk copy of list_users, keyed by API URL and account so runs don't share users.
+        # It holds names and emails, so it lives in the user's own cache dir, readable only by them
+        cache_key = hashlib.sha256(
+            f"{self.base_url}|{settings.gong_access_key}".encode()
+        ).hexdigest()[:16]
+        self._user_cache_path = _user_cache_dir() / f"gong_users_{cache_key}.json"
 
         self._client = httpx.AsyncClient(
-            timeout=timeout,
+            # Retries (429 & 5xx, network errors) happen in the transport
+            transport=RetryTransport(
+                httpx.AsyncHTTPTransport(
+                    http2=True,
+                    # Keep idle connections around between pagination/transcript waves
+                    limits=httpx.Limits(
+                        max_keepalive_connections=32,
+                        max_connections=64,
+                        keepalive_expiry=60.0,
+                    ),
+                ),
+                max_retries=max_retries,
+                backoff_factor=backoff_factor,
+                backoff=self._backoff_sleep,
+            ),
+            # Fail fast on unreachable hosts; long reads still get the full timeout
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 10.0)),
             headers={
                 "Accept": "application/json",
                 "Content-Type": "application/json",
@@ -65,13 +117,41 @@ class AsyncGongClient:
         await self.aclose()
 
     async def list_users(self) -> list[dict[str, Any]]:
-        """Fetch all Gong users."""
+        """Fetch all Gong users, reusing the on-disk copy while it is fresh."""
+        path = self._user_cache_path
+        try:
+            fetched_at = path.stat().st_mtime
+            if time.time() - fetched_at < USER_CACHE_TTL_SECONDS:
+                users = orjson.loads(path.read_bytes())
+                self._users_fetched_at = fetched_at
+                return users
+        except (OSError, orjson.JSONDecodeError):
+            pass  # Missing or unreadable cache: fall through to the API
+
         data = await self._api_call(
             "/v2/users",
             "GET",
             query={"limit": self.default_limit},
         )
-        return data.get("users", [])
+        users = data.get("users", [])
+        self._users_fetched_at = time.time()
+
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            # Create owner-only (0600) rather than with the umask default
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(users))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Could not write Gong user cache %s: %s", path, e)
+        return users
+
+    def invalidate_user_cache(self) -> None:
+        """Drop the cached user list so the next lookup refetches it from Gong."""
+        self._email_index = None
+        self._user_cache_path.unlink(missing_ok=True)
 
     async def get_user_ids_for_emails(
         self, emails: list[str]
@@ -86,15 +166,29 @@ class AsyncGongClient:
             Dictionary mapping email -> user_id
         """
         targets = {e.strip().lower() for e in emails if e and e.strip()}
-        email_to_id: dict[str, str] = {}
-        users = await self.list_users()
-
-        for u in users:
-            email = (u.get("emailAddress") or u.get("email") or "").strip().lower()
-            if email in targets:
-                email_to_id[email] = u.get("id")
-
-        return email_to_id
+        email_index = await self._get_email_index()
+        missing = targets - email_index.keys()
+        if missing and time.time() - self._users_fetched_at >= USER_CACHE_REFETCH_AFTER_SECONDS:
+            # Possibly a rep added in Gong since the disk copy was written: refetch once.
+            # A younger copy is trusted, so an email that isn't a Gong user (a departed
+            # rep, a typo) doesn't cost a full user list fetch on every run
+            self.invalidate_user_cache()
+            email_index = await self._get_email_index()
+            missing = targets - email_index.keys()
+        if missing:
+            logger.warning("No Gong user for: %s", ", ".join(sorted(missing)))
+        return {e: email_index[e] for e in targets if e in email_index}
+
+    async def _get_email_index(self) -> dict[str, str]:
+        """Get the normalized email -> user ID index, fetching users on first use."""
+        if self._email_index is None:
+            # Normalize each user's email once, in a single pass over the list
+            self._email_index = {
+                email: u.get("id")
+                for u in await self.list_users()
+                if (email := (u.get("emailAddress") or u.get("email") or "").strip().lower())
+            }
+        return self._email_index
 
     async def get_calls_for_sales_reps(
         self, sales_rep_emails: list[str], include_all_fields: bool = False
@@ -152,7 +246,10 @@ class AsyncGongClient:
         id_to_email = {v: k for k, v in email_to_id.items()}
 
         for call in all_calls:
-            if self._has_external_participants(call):
+            has_external, participants = self._classify_parties(call)
+            if has_external:
+                # Keep the classification so extract_participants doesn't redo it
+                call["_participants"] = participants
                 # Enrich with sales rep email
                 meta = call.get("metaData", {})
                 primary_user_id = meta.get("primaryUserId")
@@ -176,10 +273,9 @@ class AsyncGongClient:
         """
         path = "/v2/calls/transcript"
         transcripts: dict[str, str] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        for i in range(0, len(call_ids), chunk_size):
-            batch = call_ids[i:i + chunk_size]
-
+        async def fetch_batch(batch: list[str]) -> None:
             # Build payload with filter structure (some Gong APIs expect this)
             payload = {
                 "filter": {
@@ -187,54 +283,68 @@ class AsyncGongClient:
                 }
             }
 
-            data = await self._api_call(
-                path,
-                "POST",
-                payload=payload,
-                paginate=True,  # Follow pagination to get all transcripts
-            )
+            # Assemble each page's transcripts as it arrives, so raw pages
+            # aren't all held in memory at once
+            async with semaphore:
+                async for page in self._paginate(path, "POST", payload=payload):
+                    # Try different possible response structures
+                    for t in page.get("callTranscripts", []) or page.get("transcripts", []):
+                        transcripts[t.get("callId")] = self._assemble_transcript(t)
 
-            print(f"\n[DEBUG] Transcript API response keys: {list(data.keys())}")
+        # Fetch batches concurrently over the shared connection pool
+        batches = [call_ids[i:i + chunk_size] for i in range(0, len(call_ids), chunk_size)]
+        await asyncio.gather(*(fetch_batch(batch) for batch in batches))
 
-            # Try different possible response structures
-            transcript_list = data.get("callTranscripts", []) or data.get("transcripts", [])
-            print(f"[DEBUG] Found {len(transcript_list)} transcripts in response")
+        return transcripts
 
-            for t in transcript_list:
-                call_id = t.get("callId")
-                print(f"[DEBUG] Processing transcript for call {call_id}")
-                print(f"[DEBUG] Transcript object keys: {list(t.keys())}")
+    @staticmethod
+    def _assemble_transcript(call_transcript: dict[str, Any]) -> str:
+        """Join a call's transcript segments into "[speaker]: text" lines."""
+        # Try both "sentences" and "transcript" keys (Gong API varies);
+        # each speaker segment has a nested "sentences" array
+        transcript_segments = call_transcript.get("sentences") or call_transcript.get("transcript", [])
+        return "\n".join(
+            f"[{segment.get('speakerId', 'Unknown')}]: {sentence['text']}"
+            for segment in transcript_segments
+            if isinstance(segment, dict)
+            for sentence in segment.get("sentences", ())
+            if isinstance(sentence, dict) and sentence.get("text")
+        )
 
-                # Try both "sentences" and "transcript" keys (Gong API varies)
-                transcript_segments = t.get("sentences") or t.get("transcript", [])
-                print(f"[DEBUG] Found {len(transcript_segments)} transcript segments")
+    def _classify_parties(self, call: dict[str, Any]) -> tuple[bool, Participants]:
+        """
+        Classify a call's parties in a single pass.
 
-                # Combine all sentences into text
-                text_parts = []
-                for segment in transcript_segments:
-                    if isinstance(segment, dict):
-                        speaker_id = segment.get("speakerId", "Unknown")
-                        # Each segment has a nested "sentences" array
-                        sentences = segment.get("sentences", [])
+        Returns:
+            (whether any party is external, participants with an email address)
+        """
+        internal = []
+        external = []
+        has_external = False
 
-                        for sentence in sentences:
-                            if isinstance(sentence, dict):
-                                text = sentence.get("text", "")
-                                if text:
-                                    text_parts.append(f"[{speaker_id}]: {text}")
+        for party in call.get("parties", []):
+            is_external = self._is_external_party(party)
+            has_external = has_external or is_external
 
-                transcripts[call_id] = "\n".join(text_parts)
-                print(f"[DEBUG] Final transcript length for {call_id}: {len(transcripts[call_id])} chars")
+            email = party.get("emailAddress")
+            if not email:
+                continue
 
-                if call_id:
-                    print(f"[DEBUG] Transcript length for {call_id}: {len(transcripts[call_id])} chars")
+            if is_external:
+                external.append(email)
+            else:
+                internal.append(email)
 
-        return transcripts
+        # Account domain comes from the first external participant
+        primary_external_domain = None
+        if external:
+            primary_external_domain = external[0].rpartition("@")[2]
 
-    def _has_external_participants(self, call: dict[str, Any]) -> bool:
-        """Check if call has any external participants."""
-        parties = call.get("parties", [])
-        return any(self._is_external_party(p) for p in parties)
+        return has_external, Participants(
+            internal=internal,
+            external=external,
+            primary_external_domain=primary_external_domain,
+        )
 
     def _is_external_party(self, party: dict[str, Any]) -> bool:
         """
@@ -250,28 +360,17 @@ class AsyncGongClient:
         if aff == "External":
             return True
 
-        if aff == "Unknown" and email and "@" in email:
-            domain = email.split("@")[-1]
-            return domain != self.internal_domain.lower()
+        if aff == "Unknown" and "@" in email:
+            return email.rpartition("@")[2] != self._internal_domain_lc
 
         return False
 
     def extract_participants(self, call: dict[str, Any]) -> Participants:
         """Extract and classify participants from a call."""
-        internal = []
-        external = []
-
-        for party in call.get("parties", []):
-            email = party.get("emailAddress")
-            if not email:
-                continue
-
-            if self._is_external_party(party):
-                external.append(email)
-            else:
-                internal.append(email)
-
-        return Participants(internal=internal, external=external)
+        participants = call.get("_participants")
+        if participants is None:
+            participants = self._classify_parties(call)[1]
+        return participants
 
     async def _api_call(
         self,
@@ -293,49 +392,82 @@ class AsyncGongClient:
             paginate: Whether to follow pagination cursors
 
         Returns:
-            API response data
+            API response data (array fields concatenated across pages)
         """
-        if not api_path.startswith("/"):
-            api_path = "/" + api_path
-        url = urljoin(self.base_url, api_path.lstrip("/"))
+        aggregated: Optional[dict[str, Any]] = None
+        async for resp_json in self._paginate(api_path, method, payload=payload, query=query):
+            if not paginate:
+                return resp_json
+
+            # The first page becomes the aggregate as-is, so single-page
+            # responses (the common case) skip merging entirely
+            if aggregated is None:
+                aggregated = resp_json
+            else:
+                self._merge_page(aggregated, resp_json)
+
+        return aggregated or {}
+
+    @staticmethod
+    def _merge_page(aggregated: dict[str, Any], resp_json: dict[str, Any]) -> None:
+        """Fold one page into the aggregate: array fields are concatenated, others overwritten."""
+        for k, v in resp_json.items():
+            if isinstance(v, list):
+                aggregated.setdefault(k, []).extend(v)
+            else:
+                aggregated[k] = v
+
+    async def _paginate(
+        self,
+        api_path: str,
+        method: str,
+        *,
+        payload: Optional[dict[str, Any]] = None,
+        query: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield each page of a paginated API response, following cursors.
+
+        Args:
+            api_path: API endpoint path
+            method: HTTP method (GET or POST)
+            payload: Request body for POST
+            query: Query parameters for GET
+
+        Yields:
+            One page of API response data
+        """
+        # base_url always ends in "/", so plain concatenation matches urljoin here
+        url = self.base_url + api_path.lstrip("/")
+        is_get = method.upper() == "GET"
 
         body = dict(payload or {})
         params = dict(query or {})
-        aggregated: dict[str, Any] = {}
         cursor: Optional[str] = None
 
         while True:
             if cursor:
-                if method.upper() == "GET":
+                if is_get:
                     params["cursor"] = cursor
                 else:
                     body["cursor"] = cursor
 
-            resp_json = await self._request_with_retries(
+            resp_json = await self._request(
                 url=url,
                 method=method,
-                body=body if method.upper() != "GET" else None,
-                params=params if method.upper() == "GET" else None,
+                body=None if is_get else body,
+                params=params if is_get else None,
             )
-
-            if not paginate:
-                return resp_json
-
-            # Aggregate array fields
-            for k, v in resp_json.items():
-                if isinstance(v, list):
-                    aggregated.setdefault(k, []).extend(v)
-                else:
-                    aggregated[k] = v
+            yield resp_json
 
             # Check for next page
             records = resp_json.get("records", {})
             cursor = records.get("cursor") if isinstance(records, dict) else resp_json.get("cursor")
 
             if not cursor:
-                return aggregated
+                return
 
-    async def _request_with_retries(
+    async def _request(
         self,
         *,
         url: str,
@@ -343,43 +475,37 @@ class AsyncGongClient:
         body: Optional[dict[str, Any]],
         params: Optional[dict[str, Any]],
     ) -> dict[str, Any]:
-        """Make HTTP request with retry logic."""
-        import asyncio
+        """Make an HTTP request (retried by the client's transport) and parse the JSON."""
+        try:
+            resp = await self._client.request(
+                method=method,
+                url=url,
+                params=params,
+                content=None if body is None else orjson.dumps(body),
+            )
+        except httpx.RequestError as e:
+            raise GongAPIError(f"Request failed after retries: {e}") from e
 
-        attempt = 0
-        while True:
-            try:
-                resp = await self._client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    content=None if body is None else json.dumps(body),
-                )
-            except httpx.RequestError as e:
-                if attempt >= self.max_retries:
-                    raise GongAPIError(f"Request failed after retries: {e}") from e
-                await asyncio.sleep(self._backoff_sleep(attempt))
-                attempt += 1
-                continue
+        # Non-success (including 429/5xx once retries are exhausted)
+        if resp.status_code >= 400:
+            raise GongAPIError(f"HTTP {resp.status_code}: {resp.text}")
 
-            # Retry on rate limit or server errors
-            if resp.status_code in (429, 500, 502, 503, 504):
-                if attempt >= self.max_retries:
-                    raise GongAPIError(f"HTTP {resp.status_code}: {resp.text}")
-                await asyncio.sleep(self._backoff_sleep(attempt))
-                attempt += 1
-                continue
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError as e:
+            raise GongAPIError(f"Invalid JSON response: {e}") from e
 
-            # Non-success
-            if resp.status_code >= 400:
-                raise GongAPIError(f"HTTP {resp.status_code}: {resp.text}")
+    def _backoff_sleep(self, prev_sleep: float) -> float:
+        """
+        Calculate the next backoff sleep time ("decorrelated jitter").
 
-            try:
-                return resp.json()
-            except ValueError as e:
-                raise GongAPIError(f"Invalid JSON response: {e}") from e
+        Randomizing each wait keeps concurrent batches that hit a 429 together
+        from retrying in lockstep.
 
-    def _backoff_sleep(self, attempt: int) -> float:
-        """Calculate exponential backoff sleep time."""
-        base = (2 ** attempt) * self.backoff_factor
-        return min(base, 30.0)
+        Args:
+            prev_sleep: Previous sleep time (backoff_factor before the first retry)
+
+        Returns:
+            Seconds to sleep, between backoff_factor and 30
+        """
+        return random.uniform(self.backoff_factor, min(30.0, prev_sleep * 3))
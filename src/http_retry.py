@@ -0,0 +1,71 @@
+"""Retrying httpx transport shared by the Gong and Slack clients."""
+
+import asyncio
+from typing import Callable, Optional
+
+import httpx
+
+# Rate limits and transient server errors
+DEFAULT_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that re-sends requests on retryable statuses and network errors.
+
+    Retrying below the client means each attempt goes back through the
+    connection pool, so a request sleeping in backoff doesn't hold a connection.
+    A Retry-After header, when present, overrides the backoff delay.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.AsyncBaseTransport,
+        *,
+        max_retries: int,
+        backoff_factor: float,
+        backoff: Callable[[float], float],
+        retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: tuple[type[Exception], ...] = (httpx.TransportError,),
+    ) -> None:
+        self._inner = inner
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._backoff = backoff
+        self.retry_statuses = retry_statuses
+        self.retry_exceptions = retry_exceptions
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        delay = self.backoff_factor
+        while True:
+            try:
+                resp = await self._inner.handle_async_request(request)
+            except self.retry_exceptions:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            # Retry on rate limit or server errors; the last response is returned as-is
+            if resp.status_code not in self.retry_statuses or attempt >= self.max_retries:
+                return resp
+
+            await resp.aclose()
+            delay = self._backoff(delay)
+            retry_after = self._retry_after(resp)
+            await asyncio.sleep(retry_after if retry_after is not None else delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+    @staticmethod
+    def _retry_after(resp: httpx.Response) -> Optional[float]:
+        """Seconds the server asked us to wait (Retry-After), capped at 60."""
+        try:
+            return min(float(resp.headers["Retry-After"]), 60.0)
+        except (KeyError, ValueError):
+            return None
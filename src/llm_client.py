@@ -1,43 +1,30 @@
 """LLM client for analyzing transcripts."""
 
-import json
+import asyncio
+import logging
+import math
+import time
+from collections import Counter
+from typing import Any, Optional
 
-from anthropic import AsyncAnthropic
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
 from .config import Settings
-from .models import AnalysisNotes, MEDDPICCScores
+from .models import MEDDPICC_DIMENSIONS, AnalysisNotes, MEDDPICCScores
 
+logger = logging.getLogger(__name__)
 
-class LLMClient:
-    """Client for interacting with LLM APIs."""
-
-    def __init__(self, settings: Settings):
-        """Initialize the LLM client."""
-        self.provider = settings.llm_provider
-        self.model = settings.llm_model
-
-        if self.provider == "anthropic":
-            self.client = AsyncAnthropic(api_key=settings.llm_api_key)
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.provider}")
-
-    async def is_discovery_call(self, transcript: str) -> tuple[bool, str]:
-        """
-        Classify if a transcript is a discovery call.
-
-        Checks:
-        1. Is this a discovery/qualification call?
-        2. Did external participants actively engage?
 
-        Args:
-            transcript: The call transcript text
+# Bump whenever the prompts or tool schemas change, so cached results from older
+# prompts are no longer reused
+PROMPT_VERSION = "3"
 
-        Returns:
-            Tuple of (is_discovery, reasoning)
-        """
-        prompt = f"""Analyze this sales call transcript and determine if it is a DISCOVERY CALL.
-
-✅ IT IS A DISCOVERY CALL if it includes ANY of these (doesn't need all):
+# Static instructions live in the system prompt, byte-identical across calls; only the
+# transcript varies per request. The prefix (~2k tokens with the tool schema) is marked
+# for prompt caching, which only takes effect on models whose minimum cacheable prompt
+# it reaches (1024 tokens for Sonnet/Opus; not Haiku 4.5, which needs 4096).
+_DISCOVERY_CRITERIA = """✅ IT IS A DISCOVERY CALL if it includes ANY of these (doesn't need all):
 1. **Product introduction** - Explaining what CodeRabbit is, how it works, demonstrations
 2. **Customer needs exploration** - Asking about their current code review process, challenges, team size, tech stack
 3. **Feature discussions** - Explaining CodeRabbit features, integrations, capabilities
@@ -80,74 +67,9 @@ Example 4 - ❌ NOT DISCOVERY (Technical Troubleshooting):
 "[Customer]: We're getting an error when CodeRabbit tries to access our monorepo."
 "[Sales Rep]: Let me check the logs. What's the exact error message?"
 "[Customer]: It says 'timeout after 30 seconds' on this specific file..."
-→ FALSE: Deep technical debugging, not product introduction
-
-<transcript>
-{transcript[:12000]}
-</transcript>
-
-Analyze the transcript and respond with ONLY a valid JSON object (no markdown, no code blocks, no extra text):
-{{
-  "is_discovery_call": true,
-  "reasoning": "Brief explanation (1-2 sentences) of why this is or isn't a discovery call based on the criteria above"
-}}
-
-OR
-
-{{
-  "is_discovery_call": false,
-  "reasoning": "Brief explanation (1-2 sentences) of why this is or isn't a discovery call based on the criteria above"
-}}"""
-
-        response = await self.client.messages.create(
-            model=self.model,
-            max_tokens=1024,
-            temperature=0,
-            messages=[{"role": "user", "content": prompt}],
-        )
+→ FALSE: Deep technical debugging, not product introduction"""
 
-        # Parse response
-        content = response.content[0].text
-        try:
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in content:
-                json_start = content.find("```json") + 7
-                json_end = content.find("```", json_start)
-                content = content[json_start:json_end].strip()
-            elif "```" in content:
-                json_start = content.find("```") + 3
-                json_end = content.find("```", json_start)
-                content = content[json_start:json_end].strip()
-
-            result = json.loads(content)
-            is_discovery = result.get("is_discovery_call", False)
-            reasoning = result.get("reasoning", "No reasoning provided")
-            return is_discovery, reasoning
-        except json.JSONDecodeError as e:
-            # Log the actual response for debugging
-            print(f"\n[DEBUG] Failed to parse LLM response: {e}")
-            print(f"[DEBUG] Raw response: {content[:500]}")
-
-            # Fallback: look for true/false in response
-            is_discovery = "true" in content.lower() and "is_discovery_call" in content.lower()
-            reasoning = f"Parse error: {content[:200]}..."
-            return is_discovery, reasoning
-
-    async def score_meddpicc(
-        self, transcript: str
-    ) -> tuple[MEDDPICCScores, AnalysisNotes, str]:
-        """
-        Score a transcript on MEDDPICC dimensions.
-
-        Args:
-            transcript: The call transcript text
-
-        Returns:
-            Tuple of (scores, analysis_notes, summary)
-        """
-        prompt = f"""Analyze this discovery call transcript and score it on each MEDDPICC dimension (0-5 scale).
-
-IMPORTANT: Be STRICT in your evaluation. Only award high scores (4-5) when criteria are clearly and explicitly met with specific evidence. Use 0 when a dimension is absent, vague, or minimally mentioned.
+_MEDDPICC_FRAMEWORK = """IMPORTANT: Be STRICT in your evaluation. Only award high scores (4-5) when criteria are clearly and explicitly met with specific evidence. Use 0 when a dimension is absent, vague, or minimally mentioned.
 
 MEDDPICC Scoring Framework:
 
@@ -202,128 +124,431 @@ Named tools include: Greptile, BugBot, Copilot, Claude, Graphite, Macroscope, So
 4: Specific competitor tools named with some context about their usage
 3: General mention of competitors or categories (e.g., "looking at AI tools", "comparing with others")
 2: Vague competitive awareness (e.g., "might check alternatives")
-0: No discussion of what customer currently uses or is considering
-
-<transcript>
-{transcript[:15000]}
-</transcript>
-
-CRITICAL: Respond with valid JSON in a markdown code block. Use this EXACT format with NO trailing commas:
-{{
-  "scores": {{
-    "metrics": 2,
-    "economic_buyer": 0,
-    "decision_criteria": 4,
-    "decision_process": 3,
-    "paper_process": 0,
-    "identify_pain": 4,
-    "champion": 3,
-    "competition": 0
-  }},
-  "summary": "2-3 sentence overall assessment highlighting key strengths and gaps in MEDDPICC coverage",
-  "notes": {{
-    "metrics": "Brief explanation for this score (cite specific evidence or lack thereof)",
-    "economic_buyer": "Brief explanation for this score (cite specific evidence or lack thereof)",
-    "decision_criteria": "Brief explanation for this score (cite specific evidence or lack thereof)",
-    "decision_process": "Brief explanation for this score (cite specific evidence or lack thereof)",
-    "paper_process": "Brief explanation for this score (cite specific evidence or lack thereof)",
-    "identify_pain": "Brief explanation for this score (cite specific evidence or lack thereof)",
-    "champion": "Brief explanation for this score (cite specific evidence or lack thereof)",
-    "competition": "Brief explanation for this score (cite specific evidence or lack thereof)"
-  }}
-}}"""
-
-        response = await self.client.messages.create(
+0: No discussion of what customer currently uses or is considering"""
+
+DISCOVERY_SYSTEM = f"""Analyze the sales call transcript in the user message and determine if it is a DISCOVERY CALL.
+
+{_DISCOVERY_CRITERIA}
+
+Record your answer with the record_discovery_classification tool."""
+
+MEDDPICC_SYSTEM = f"""Analyze the discovery call transcript in the user message and score it on each MEDDPICC dimension (0-5 scale).
+
+{_MEDDPICC_FRAMEWORK}
+
+Record the scores, overall summary and per-dimension notes with the record_meddpicc tool."""
+
+ANALYZE_SYSTEM = f"""Analyze the sales call transcript in the user message. First determine if it is a DISCOVERY CALL. If it is, also score it on each MEDDPICC dimension (0-5 scale).
+
+{_DISCOVERY_CRITERIA}
+
+{_MEDDPICC_FRAMEWORK}
+
+Record your answer with the record_call_analysis tool. If it is NOT a discovery call, leave out "scores", "summary" and "notes"."""
+
+
+# Per-request user message: the transcript, then a one-line instruction
+_TRANSCRIPT_OPEN = "<transcript>\n"
+_TRANSCRIPT_CLOSE = "\n</transcript>\n\n"
+DISCOVERY_INSTRUCTION = "Classify this transcript."
+MEDDPICC_INSTRUCTION = "Score this transcript on each MEDDPICC dimension."
+ANALYZE_INSTRUCTION = "Classify this transcript, and score it on each MEDDPICC dimension if it is a discovery call."
+
+
+def _user_message(transcript: str, instruction: str) -> list[dict]:
+    """Messages list for a request: the (already trimmed) transcript plus an instruction."""
+    content = "".join((_TRANSCRIPT_OPEN, transcript, _TRANSCRIPT_CLOSE, instruction))
+    return [{"role": "user", "content": content}]
+
+
+# Tool schemas: forcing the model to call a tool makes it return structured input
+# instead of free-form text that would need JSON extraction
+
+_DISCOVERY_PROPERTIES = {
+    "is_discovery_call": {"type": "boolean"},
+    "reasoning": {
+        "type": "string",
+        "description": "Brief explanation (1-2 sentences) of why this is or isn't a discovery call based on the criteria above",
+    },
+}
+
+_MEDDPICC_PROPERTIES = {
+    "scores": {
+        "type": "object",
+        "properties": {d: {"type": "integer", "minimum": 0, "maximum": 5} for d in MEDDPICC_DIMENSIONS},
+        "required": list(MEDDPICC_DIMENSIONS),
+    },
+    "summary": {
+        "type": "string",
+        "description": "2-3 sentence overall assessment highlighting key strengths and gaps in MEDDPICC coverage",
+    },
+    "notes": {
+        "type": "object",
+        "properties": {
+            d: {
+                "type": "string",
+                "description": "Brief explanation for this score (cite specific evidence or lack thereof)",
+            }
+            for d in MEDDPICC_DIMENSIONS
+        },
+        "required": list(MEDDPICC_DIMENSIONS),
+    },
+}
+
+DISCOVERY_TOOL = {
+    "name": "record_discovery_classification",
+    "description": "Record whether the transcript is a discovery call.",
+    "input_schema": {
+        "type": "object",
+        "properties": _DISCOVERY_PROPERTIES,
+        "required": ["is_discovery_call", "reasoning"],
+    },
+}
+
+MEDDPICC_TOOL = {
+    "name": "record_meddpicc",
+    "description": "Record the MEDDPICC scores, summary and per-dimension notes for a discovery call.",
+    "input_schema": {
+        "type": "object",
+        "properties": _MEDDPICC_PROPERTIES,
+        "required": ["scores", "summary", "notes"],
+    },
+}
+
+ANALYSIS_TOOL = {
+    "name": "record_call_analysis",
+    "description": "Record the discovery classification and, for discovery calls, the MEDDPICC assessment.",
+    "input_schema": {
+        "type": "object",
+        "properties": {**_DISCOVERY_PROPERTIES, **_MEDDPICC_PROPERTIES},
+        "required": ["is_discovery_call", "reasoning"],
+    },
+}
+
+
+# Transcript budgets in characters. There is no local Claude tokenizer (token
+# counting is an API call), so cuts are made on line/word boundaries instead.
+DISCOVERY_TRANSCRIPT_CHARS = 12000
+MEDDPICC_TRANSCRIPT_CHARS = 15000
+
+
+def _truncate(transcript: str, limit: int) -> str:
+    """Trim a transcript to at most ``limit`` chars, ending on a whole line or word."""
+    if len(transcript) <= limit:
+        return transcript
+    # Search the original string with bounds rather than slicing it first,
+    # so only the returned text is copied
+    cut = transcript.rfind("\n", 0, limit)
+    if cut < limit * 0.9:
+        cut = transcript.rfind(" ", 0, limit)
+    return transcript[:cut] if cut > 0 else transcript[:limit]
+
+
+_ELISION = "\n[...]\n"
+
+
+def _truncate_ends(transcript: str, limit: int) -> str:
+    """
+    Trim a transcript to at most ``limit`` chars, keeping its opening and close.
+
+    MEDDPICC evidence clusters at both ends of a call: needs and stakeholders
+    come up early, pricing, process and next steps late. The first third of
+    the budget goes to the opening and the rest to the close, with the middle
+    replaced by an elision marker.
+    """
+    if len(transcript) <= limit:
+        return transcript
+    head = _truncate(transcript, limit // 3)
+    tail_budget = limit - len(head) - len(_ELISION)
+    tail_start = len(transcript) - tail_budget
+    # Start the tail on a whole line (or word) when one begins close to the cut
+    window_end = tail_start + math.ceil(tail_budget * 0.1)
+    start = transcript.find("\n", tail_start, window_end)
+    if start < 0:
+        start = transcript.find(" ", tail_start, window_end)
+    if start >= 0:
+        tail_start = start + 1
+    return "".join((head, _ELISION, transcript[tail_start:]))
+
+
+# One HTTP/2 connection pool for all LLMClient instances in the process, created on
+# first use so it belongs to the running event loop
+_shared_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_http() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client for Anthropic requests."""
+    global _shared_http
+    if _shared_http is None or _shared_http.is_closed:
+        _shared_http = DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=60.0,
+            ),
+        )
+    return _shared_http
+
+
+class _TokenBucket:
+    """
+    Async token bucket refilled continuously at ``per_minute`` units per minute.
+
+    Callers wait in FIFO order until enough budget has accumulated, which spreads
+    requests out instead of bursting into the API's rate limits.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` units are available, then take them."""
+        # A request larger than the whole bucket would otherwise wait forever
+        amount = min(amount, self.capacity)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+def _estimate_input_tokens(kwargs: dict[str, Any]) -> int:
+    """Rough input token count for a messages request (about 4 chars per token)."""
+    chars = sum(len(block["text"]) for block in kwargs.get("system", ()))
+    chars += sum(len(m["content"]) for m in kwargs.get("messages", ()))
+    return chars // 4
+
+
+_USAGE_FIELDS = (
+    "input_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+    "output_tokens",
+)
+
+# The SDK retries 429/5xx responses with jittered exponential backoff (honouring
+# Retry-After); allow a few more attempts than its default of 2 for concurrent use
+LLM_MAX_RETRIES = 5
+
+
+def _meddpicc_scores(scores_dict: dict) -> MEDDPICCScores:
+    """
+    Build MEDDPICC scores from the LLM's "scores" object, computing the overall.
+
+    Raises:
+        KeyError: If a dimension is missing
+    """
+    scores = {d: scores_dict[d] for d in MEDDPICC_DIMENSIONS}
+    scores["overall_score"] = round(sum(scores.values()) / len(MEDDPICC_DIMENSIONS), 1)
+    return MEDDPICCScores.model_validate(scores)
+
+
+def _force_tool(tool: dict) -> dict[str, Any]:
+    """Request arguments that make the model answer by calling ``tool``."""
+    return {"tools": [tool], "tool_choice": {"type": "tool", "name": tool["name"]}}
+
+
+def _tool_input(response: Any) -> dict[str, Any]:
+    """
+    Return the input of the tool call in an LLM response.
+
+    Raises:
+        ValueError: If the response contains no tool call
+    """
+    for block in response.content:
+        if block.type == "tool_use":
+            return block.input
+    raise ValueError(f"LLM response has no tool call (stop_reason={response.stop_reason})")
+
+
+def _cached_system(text: str) -> list[dict]:
+    """System prompt block marked for Anthropic prompt caching (if the model's minimum is met)."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+class LLMClient:
+    """Client for interacting with LLM APIs."""
+
+    def __init__(self, settings: Settings):
+        """Initialize the LLM client."""
+        self.provider = settings.llm_provider
+        self.model = settings.llm_model
+
+        # Token totals across requests; cache_read_input_tokens shows prompt-cache hits
+        self.usage: Counter[str] = Counter()
+
+        # Optional client-side pacing to stay under the account's rate limits
+        self._request_limiter = _TokenBucket(settings.llm_rpm) if settings.llm_rpm > 0 else None
+        self._token_limiter = _TokenBucket(settings.llm_tpm) if settings.llm_tpm > 0 else None
+
+        if self.provider == "anthropic":
+            self.client = AsyncAnthropic(
+                api_key=settings.llm_api_key,
+                max_retries=LLM_MAX_RETRIES,
+                http_client=_get_shared_http(),
+            )
+        else:
+            raise ValueError(f"Unsupported LLM provider: {self.provider}")
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the HTTP connection pool shared by all LLM clients."""
+        global _shared_http
+        if _shared_http is not None:
+            await _shared_http.aclose()
+            _shared_http = None
+
+    async def _create(self, **kwargs: Any) -> Any:
+        """Send a messages request and add its token usage to ``self.usage``."""
+        if self._request_limiter:
+            await self._request_limiter.acquire()
+        if self._token_limiter:
+            await self._token_limiter.acquire(_estimate_input_tokens(kwargs))
+        response = await self.client.messages.create(**kwargs)
+        usage = response.usage
+        for field in _USAGE_FIELDS:
+            self.usage[field] += getattr(usage, field, None) or 0
+        return response
+
+    async def is_discovery_call(self, transcript: str) -> tuple[bool, str]:
+        """
+        Classify if a transcript is a discovery call.
+
+        Checks:
+        1. Is this a discovery/qualification call?
+        2. Did external participants actively engage?
+
+        Args:
+            transcript: The call transcript text
+
+        Returns:
+            Tuple of (is_discovery, reasoning)
+        """
+        messages = _user_message(_truncate(transcript, DISCOVERY_TRANSCRIPT_CHARS), DISCOVERY_INSTRUCTION)
+
+        response = await self._create(
             model=self.model,
-            max_tokens=3500,  # Increased for full response with detailed notes
+            max_tokens=1024,
             temperature=0,
-            messages=[{"role": "user", "content": prompt}],
+            system=_cached_system(DISCOVERY_SYSTEM),
+            messages=messages,
+            **_force_tool(DISCOVERY_TOOL),
         )
 
-        # Parse response
-        content = response.content[0].text
+        try:
+            result = _tool_input(response)
+            return bool(result["is_discovery_call"]), result.get("reasoning", "No reasoning provided")
+        except (KeyError, ValueError) as e:
+            logger.warning("Failed to read LLM classification: %s", e)
+            return False, f"Parse error: {e}"
+
+    async def score_meddpicc(
+        self, transcript: str
+    ) -> tuple[MEDDPICCScores, AnalysisNotes, str]:
+        """
+        Score a transcript on MEDDPICC dimensions.
+
+        Args:
+            transcript: The call transcript text
+
+        Returns:
+            Tuple of (scores, analysis_notes, summary)
+        """
+        messages = _user_message(_truncate_ends(transcript, MEDDPICC_TRANSCRIPT_CHARS), MEDDPICC_INSTRUCTION)
 
-        # Retry logic for JSON parsing
         max_retries = 2
         for attempt in range(max_retries):
+            response = await self._create(
+                model=self.model,
+                max_tokens=3500,  # Increased for full response with detailed notes
+                # Retry at the default temperature so the model doesn't repeat itself
+                **({"temperature": 0} if attempt == 0 else {}),
+                system=_cached_system(MEDDPICC_SYSTEM),
+                messages=messages,
+                **_force_tool(MEDDPICC_TOOL),
+            )
+
             try:
-                # Try to extract JSON from markdown code blocks if present
-                content_to_parse = content
-                if "```json" in content_to_parse:
-                    json_start = content_to_parse.find("```json") + 7
-                    json_end = content_to_parse.find("```", json_start)
-                    content_to_parse = content_to_parse[json_start:json_end].strip()
-                elif "```" in content_to_parse:
-                    json_start = content_to_parse.find("```") + 3
-                    json_end = content_to_parse.find("```", json_start)
-                    content_to_parse = content_to_parse[json_start:json_end].strip()
-
-                # Try to clean up common JSON issues
-                # Remove trailing commas before closing braces/brackets
-                import re
-                content_to_parse = re.sub(r',(\s*[}\]])', r'\1', content_to_parse)
-
-                result = json.loads(content_to_parse)
-
-                # Calculate overall score
-                scores_dict = result["scores"]
-                overall = sum(scores_dict.values()) / len(scores_dict)
-
-                scores = MEDDPICCScores(
-                    metrics=scores_dict["metrics"],
-                    economic_buyer=scores_dict["economic_buyer"],
-                    decision_criteria=scores_dict["decision_criteria"],
-                    decision_process=scores_dict["decision_process"],
-                    paper_process=scores_dict["paper_process"],
-                    identify_pain=scores_dict["identify_pain"],
-                    champion=scores_dict["champion"],
-                    competition=scores_dict["competition"],
-                    overall_score=round(overall, 1),
-                )
-
-                summary = result.get("summary", "No summary provided")
-
-                # Validate notes has all required fields
-                notes_data = result.get("notes", {})
-                required_fields = ["metrics", "economic_buyer", "decision_criteria",
-                                  "decision_process", "paper_process", "identify_pain",
-                                  "champion", "competition"]
-                missing_fields = [f for f in required_fields if f not in notes_data]
-
-                if missing_fields and attempt < max_retries - 1:
-                    print(f"\n[WARNING] Missing fields in notes: {missing_fields}, retrying...")
-                    # Will retry in next iteration
-                    continue
-                elif missing_fields:
-                    print(f"\n[WARNING] Missing fields in notes: {missing_fields}, using defaults")
+                result = _tool_input(response)
+                scores = _meddpicc_scores(result["scores"])
 
-                notes = AnalysisNotes(**notes_data)
+                notes_data = result.get("notes") or {}
+                missing_fields = [f for f in MEDDPICC_DIMENSIONS if f not in notes_data]
+                if missing_fields:
+                    logger.warning("Missing fields in notes: %s, using defaults", missing_fields)
+                notes = AnalysisNotes.model_validate(notes_data)
 
-                return scores, notes, summary
+                return scores, notes, result.get("summary") or "No summary provided"
 
-            except (json.JSONDecodeError, KeyError) as e:
+            except (KeyError, TypeError, ValueError) as e:
                 if attempt < max_retries - 1:
-                    # Retry with a simpler prompt
-                    print(f"\n[WARNING] JSON parse failed (attempt {attempt + 1}/{max_retries}), retrying...")
-                    print(f"[DEBUG] Error: {e}")
-                    print(f"[DEBUG] Problematic JSON (first 1000 chars):\n{content[:1000]}")
-
-                    # Retry the API call with emphasis on JSON format
-                    response = await self.client.messages.create(
-                        model=self.model,
-                        max_tokens=4000,
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": f"{prompt}\n\nIMPORTANT: Return ONLY valid JSON with no trailing commas. Double-check your JSON syntax.\n\nTranscript:\n{transcript[:15000]}",
-                            }
-                        ],
+                    logger.warning(
+                        "Invalid MEDDPICC response (attempt %d/%d), retrying...", attempt + 1, max_retries
                     )
-                    content = response.content[0].text
+                    logger.debug("MEDDPICC parse error: %s", e)
                     continue
-                else:
-                    # Final attempt failed
-                    print(f"\n[ERROR] Failed to parse MEDDPICC response after {max_retries} attempts")
-                    print(f"[ERROR] Error: {e}")
-                    print(f"[ERROR] Full response:\n{content}")
-                    raise ValueError(f"Failed to parse MEDDPICC scores from LLM after {max_retries} attempts: {e}")
+                logger.error("Failed to parse MEDDPICC response after %d attempts: %s", max_retries, e)
+                raise ValueError(f"Failed to parse MEDDPICC scores from LLM after {max_retries} attempts: {e}")
+
+    async def analyze(
+        self, transcript: str
+    ) -> tuple[bool, str, Optional[tuple[MEDDPICCScores, AnalysisNotes, str]]]:
+        """
+        Classify a transcript and score MEDDPICC in a single LLM call.
+
+        Falls back to the separate is_discovery_call/score_meddpicc requests
+        for whichever part of the combined response can't be parsed.
+
+        Both parts see the opening-and-close excerpt used for scoring, so a
+        long call is classified on its head and tail rather than on the
+        head-only excerpt is_discovery_call would use on the full transcript.
+
+        Args:
+            transcript: The call transcript text
+
+        Returns:
+            Tuple of (is_discovery, reasoning, (scores, notes, summary) or None)
+        """
+        # Trim once; the fallback requests below then reuse the trimmed text as-is
+        transcript = _truncate_ends(transcript, MEDDPICC_TRANSCRIPT_CHARS)
+        messages = _user_message(transcript, ANALYZE_INSTRUCTION)
+
+        response = await self._create(
+            model=self.model,
+            max_tokens=3500,
+            temperature=0,
+            system=_cached_system(ANALYZE_SYSTEM),
+            messages=messages,
+            **_force_tool(ANALYSIS_TOOL),
+        )
+
+        classified: Optional[tuple[bool, str]] = None
+        try:
+            result = _tool_input(response)
+            classified = bool(result["is_discovery_call"]), result.get("reasoning", "No reasoning provided")
+            is_discovery, reasoning = classified
+            if not is_discovery:
+                return False, reasoning, None
+            scores = _meddpicc_scores(result["scores"])
+            notes = AnalysisNotes.model_validate(result.get("notes") or {})
+            summary = result.get("summary") or "No summary provided"
+            return True, reasoning, (scores, notes, summary)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to read combined analysis (%s), falling back to separate calls", e)
+
+        # Keep a parsed classification and only redo the part that failed
+        is_discovery, reasoning = classified or await self.is_discovery_call(transcript)
+        if not is_discovery:
+            return False, reasoning, None
+        return True, reasoning, await self.score_meddpicc(transcript)
@@ -1,21 +1,40 @@
 """Data models for the application."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# MEDDPICC dimension field names, in display order
+MEDDPICC_DIMENSIONS = (
+    "metrics",
+    "economic_buyer",
+    "decision_criteria",
+    "decision_process",
+    "paper_process",
+    "identify_pain",
+    "champion",
+    "competition",
+)
 
 
 class Participants(BaseModel):
     """Call participants separated by type."""
 
-    internal: list[str] = Field(default_factory=list)
-    external: list[str] = Field(default_factory=list)
+    # Frozen with tuple fields, so instances are hashable and safe to share
+    model_config = ConfigDict(frozen=True)
+
+    internal: tuple[str, ...] = ()
+    external: tuple[str, ...] = ()
+    primary_external_domain: Optional[str] = None  # Domain of first external participant
 
 
 class MEDDPICCScores(BaseModel):
     """MEDDPICC dimension scores (0-5 scale)."""
 
+    model_config = ConfigDict(frozen=True)
+
     metrics: int = Field(ge=0, le=5)
     economic_buyer: int = Field(ge=0, le=5)
     decision_criteria: int = Field(ge=0, le=5)
@@ -30,6 +49,8 @@ class MEDDPICCScores(BaseModel):
 class AnalysisNotes(BaseModel):
     """Detailed explanations for each MEDDPICC dimension."""
 
+    model_config = ConfigDict(frozen=True)
+
     metrics: str = "Not provided"
     economic_buyer: str = "Not provided"
     decision_criteria: str = "Not provided"
@@ -54,7 +75,7 @@ class CallAnalysis(BaseModel):
     meddpicc_scores: Optional[MEDDPICCScores] = None
     meddpicc_summary: Optional[str] = None  # Overall MEDDPICC summary
     analysis_notes: Optional[AnalysisNotes] = None
-    analysis_timestamp: datetime = Field(default_factory=datetime.now)
+    analysis_timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class AccountCall(BaseModel):
@@ -1,9 +1,9 @@
 """Repository interface for storing account call history."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from .models import AccountRecord, CallAnalysis
+from .models import AccountCall, AccountRecord, CallAnalysis
 
 
 class CallRepository(ABC):
@@ -22,6 +22,19 @@ class CallRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_accounts(self, domains: list[str]) -> dict[str, AccountRecord]:
+        """
+        Get account records for several domains in one lookup.
+
+        Args:
+            domains: Email domains
+
+        Returns:
+            Dictionary mapping domain -> AccountRecord (missing domains are omitted)
+        """
+        pass
+
     @abstractmethod
     async def upsert_account(self, account: AccountRecord) -> None:
         """
@@ -51,6 +64,29 @@ class CallRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def add_discovery_calls(
+        self, domain: str, call_analyses: list[CallAnalysis]
+    ) -> AccountRecord:
+        """
+        Add several discovery calls to an account in one write.
+
+        Creates account if it doesn't exist.
+        Updates overall_meddpicc once, to max of all calls.
+        Calls whose call_id is already on the account are skipped.
+
+        Args:
+            domain: Email domain
+            call_analyses: CallAnalysis objects with MEDDPICC scores, oldest first
+
+        Returns:
+            Updated AccountRecord
+
+        Raises:
+            ValueError: If call_analyses is empty
+        """
+        pass
+
     @abstractmethod
     async def list_domains(self) -> list[str]:
         """
@@ -74,6 +110,19 @@ class CallRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_existing_call_ids(self, call_ids: list[str]) -> set[str]:
+        """
+        Find which of the given calls have already been evaluated.
+
+        Args:
+            call_ids: The call IDs to check
+
+        Returns:
+            Subset of call_ids that exist in the database
+        """
+        pass
+
     @abstractmethod
     async def store_evaluated_call(
         self, call_id: str, is_discovery: bool, reason: Optional[str] = None
@@ -89,6 +138,42 @@ class CallRepository(ABC):
         pass
 
     @abstractmethod
+    async def get_llm_cache(self, cache_key: str) -> Optional[dict]:
+        """
+        Get a cached LLM result.
+
+        Args:
+            cache_key: Key derived from the result type and transcript hash
+
+        Returns:
+            Cached result if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def store_llm_cache(self, cache_key: str, result: dict) -> None:
+        """
+        Cache an LLM result.
+
+        Args:
+            cache_key: Key derived from the result type and transcript hash
+            result: JSON-serializable result to store
+        """
+        pass
+
+    @abstractmethod
+    def iter_accounts(self, batch_size: int = 100) -> AsyncIterator[AccountRecord]:
+        """
+        Stream all account records, fetching them in batches.
+
+        Args:
+            batch_size: Number of accounts to fetch per round-trip
+
+        Yields:
+            AccountRecord objects ordered by domain
+        """
+        pass
+
     async def get_all_accounts(self) -> list[AccountRecord]:
         """
         Get all account records.
@@ -96,6 +181,28 @@ class CallRepository(ABC):
         Returns:
             List of all AccountRecord objects
         """
+        return [account async for account in self.iter_accounts()]
+
+    @abstractmethod
+    async def get_account_stats(self) -> tuple[int, int]:
+        """
+        Count tracked accounts and their discovery calls.
+
+        Returns:
+            Tuple of (account count, discovery call count)
+        """
+        pass
+
+    @abstractmethod
+    def iter_account_calls(self) -> AsyncIterator[tuple[str, AccountCall]]:
+        """
+        Stream every discovery call without loading whole accounts.
+
+        Analysis notes are not loaded; use get_account for the full record.
+
+        Yields:
+            (domain, AccountCall) pairs ordered by domain
+        """
         pass
 
     @abstractmethod
@@ -1,10 +1,49 @@
 """Slack client for posting analysis results."""
 
 import asyncio
+import heapq
+from collections import defaultdict
+from collections.abc import AsyncIterable
+from operator import attrgetter, itemgetter
 
 import httpx
+import orjson
 
-from .models import CallAnalysis
+from .http_retry import RetryTransport
+from .models import MEDDPICC_DIMENSIONS, CallAnalysis, MEDDPICCScores
+
+# Posts are not idempotent, so only retry failures where Slack certainly didn't
+# post the message: rate limiting, and connections that were never established
+SLACK_MAX_RETRIES = 3
+_SLACK_RETRY_STATUSES = frozenset((429,))
+_SLACK_RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Sort keys, as C getters rather than per-element lambdas
+_BY_CALL_DATE = attrgetter("call_date")
+_BY_CALL_SCORE = attrgetter("meddpicc_scores.overall_score")
+_BY_ACCOUNT_SCORE = attrgetter("overall_meddpicc.overall_score")
+
+# Overall score followed by the eight dimensions, in table column order
+_SUMMARY_FIELDS = attrgetter("overall_score", *MEDDPICC_DIMENSIONS)
+_MEDDPICC_FIELDS = attrgetter(*MEDDPICC_DIMENSIONS)
+
+# Dimension score columns for the summary tables, filled from _MEDDPICC_FIELDS
+_SPACED_SCORES = "{} {} {} {} {} {} {} {}".format
+_PIPED_SCORES = "{}|{}|{}|{}|{}|{}|{}|{}".format
+_BOXED_SCORES = "{}│{}│{}│{}│{}│{}│{}│{}".format
+
+
+def _score_emoji(score: float) -> str:
+    """Traffic-light emoji for a MEDDPICC score: strong, moderate or weak."""
+    return "🟢" if score >= 4.0 else "🟡" if score >= 2.5 else "🔴"
+
+
+def _meddpicc_rows(s: MEDDPICCScores, indent: str = "") -> str:
+    """The eight MEDDPICC dimension scores as two mrkdwn lines."""
+    return (
+        f"{indent}M:{s.metrics} │ E:{s.economic_buyer} │ D:{s.decision_criteria} │ D:{s.decision_process}\n"
+        f"{indent}P:{s.paper_process} │ I:{s.identify_pain} │ C:{s.champion} │ C:{s.competition}\n"
+    )
 
 
 class SlackClient:
@@ -22,6 +61,39 @@ class SlackClient:
         self.channel_id = channel_id
         self.api_url = "https://slack.com/api/chat.postMessage"
         self.thread_ts_by_rep = {}  # Store thread timestamps for each rep
+        self.pending_evals_by_rep = {}  # Call evals buffered until flush_rep()
+
+        # One pooled client for all posts, so each message reuses the open connection.
+        # Over HTTP/2 one connection carries every request, so the pool stays small
+        self._client = httpx.AsyncClient(
+            # Rate-limited posts wait out Retry-After and are re-sent by the transport
+            transport=RetryTransport(
+                httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+                ),
+                max_retries=SLACK_MAX_RETRIES,
+                backoff_factor=1.0,
+                backoff=lambda prev: min(prev * 2, 30.0),
+                retry_statuses=_SLACK_RETRY_STATUSES,
+                retry_exceptions=_SLACK_RETRY_EXCEPTIONS,
+            ),
+            timeout=10.0,
+            headers={
+                "Authorization": f"Bearer {bot_token}",
+                "Content-Type": "application/json",
+            },
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "SlackClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
 
     async def post_rep_thread_header(self, rep_email: str) -> bool:
         """
@@ -48,29 +120,20 @@ class SlackClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("ok"):
-                        # Store the thread timestamp for this rep
-                        self.thread_ts_by_rep[rep_email] = result["ts"]
-                        return True
-                    else:
-                        print(f"[ERROR] Slack API error: {result.get('error')}")
-                        return False
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                if result.get("ok"):
+                    # Store the thread timestamp for this rep
+                    self.thread_ts_by_rep[rep_email] = result["ts"]
+                    return True
                 else:
-                    print(f"[ERROR] HTTP {response.status_code}: {response.text}")
+                    print(f"[ERROR] Slack API error: {result.get('error')}")
                     return False
+            else:
+                print(f"[ERROR] HTTP {response.status_code}: {response.text}")
+                return False
 
         except Exception as e:
             print(f"[ERROR] Failed to post thread header for {rep_email}: {e}")
@@ -95,67 +158,110 @@ class SlackClient:
             print(f"[ERROR] No thread_ts found for {analysis.sales_rep_email}")
             return False
 
-        # Build message
-        s = analysis.meddpicc_scores
-        date = analysis.call_date.strftime("%Y-%m-%d")
-
-        # Color code based on score
-        if s.overall_score >= 4.0:
-            emoji = "🟢"
-        elif s.overall_score >= 2.5:
-            emoji = "🟡"
-        else:
-            emoji = "🔴"
-
-        message_text = (
-            f"{emoji} *<{analysis.gong_link}|{analysis.call_title}>*\n"
-            f"📅 {date}\n\n"
-            f"*MEDDPICC Score: {s.overall_score:.1f}/5.0*\n"
-            f"M:{s.metrics} │ E:{s.economic_buyer} │ D:{s.decision_criteria} │ D:{s.decision_process}\n"
-            f"P:{s.paper_process} │ I:{s.identify_pain} │ C:{s.champion} │ C:{s.competition}\n\n"
-        )
-
-        if analysis.meddpicc_summary:
-            message_text += f"💡 _{analysis.meddpicc_summary}_"
-
         payload = {
             "channel": self.channel_id,
             "thread_ts": thread_ts,  # Post as reply in thread
-            "text": f"{analysis.call_title} - {s.overall_score}/5.0",
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": message_text,
-                    },
-                }
-            ],
+            **self._build_call_message(analysis, indent=""),
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
 
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("ok", False)
-                else:
-                    print(f"[ERROR] HTTP {response.status_code}: {response.text}")
-                    return False
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result.get("ok", False)
+            else:
+                print(f"[ERROR] HTTP {response.status_code}: {response.text}")
+                return False
 
         except Exception as e:
             print(f"[ERROR] Failed to post call eval: {e}")
             return False
 
+    def queue_call_eval(self, analysis: CallAnalysis) -> None:
+        """
+        Buffer a discovery call evaluation to be posted by flush_rep().
+
+        Args:
+            analysis: CallAnalysis object for a discovery call
+        """
+        if not analysis.is_discovery_call or not analysis.meddpicc_scores:
+            return
+
+        self.pending_evals_by_rep.setdefault(analysis.sales_rep_email, []).append(analysis)
+
+    async def flush_rep(self, rep_email: str) -> bool:
+        """
+        Post all buffered call evaluations for a rep as thread replies.
+
+        Evaluations are combined into as few messages as possible
+        (one section block per call, up to Slack's 50-block limit).
+
+        Args:
+            rep_email: Sales rep email address
+
+        Returns:
+            True if all messages posted successfully (or nothing to post), False otherwise
+        """
+        analyses = self.pending_evals_by_rep.pop(rep_email, [])
+        if not analyses:
+            return True
+
+        # Get thread_ts for this rep
+        thread_ts = self.thread_ts_by_rep.get(rep_email)
+        if not thread_ts:
+            print(f"[ERROR] No thread_ts found for {rep_email}")
+            return False
+
+        try:
+            for i in range(0, len(analyses), 50):
+                batch = analyses[i:i + 50]
+                payload = {
+                    "channel": self.channel_id,
+                    "thread_ts": thread_ts,  # Post as reply in thread
+                    "text": f"{len(batch)} discovery call eval{'s' if len(batch) != 1 else ''} for {rep_email}",
+                    "blocks": [
+                        {
+                            "type": "section",
+                            "text": {
+                                "type": "mrkdwn",
+                                "text": self._build_call_eval_text(analysis),
+                            },
+                        }
+                        for analysis in batch
+                    ],
+                }
+
+                response = await self._client.post(self.api_url, content=orjson.dumps(payload))
+
+                if response.status_code != 200 or not orjson.loads(response.content).get("ok"):
+                    print(f"[ERROR] Failed to post call evals for {rep_email}: {response.text}")
+                    return False
+
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to post call evals for {rep_email}: {e}")
+            return False
+
+    def _build_call_eval_text(self, analysis: CallAnalysis, indent: str = "") -> str:
+        """Build the mrkdwn text for a single call evaluation, each line prefixed by ``indent``."""
+        s = analysis.meddpicc_scores
+        date = analysis.call_date.strftime("%Y-%m-%d")
+        emoji = _score_emoji(s.overall_score)
+
+        message_text = (
+            f"{indent}{emoji} *<{analysis.gong_link}|{analysis.call_title}>*\n"
+            f"{indent}📅 {date}\n\n"
+            f"{indent}*MEDDPICC Score: {s.overall_score:.1f}/5.0*\n"
+            f"{_meddpicc_rows(s, indent)}\n"
+        )
+
+        if analysis.meddpicc_summary:
+            message_text += f"{indent}💡 _{analysis.meddpicc_summary}_"
+
+        return message_text
+
     async def post_rep_completion_summary(self, rep_email: str, discovery_count: int, total_count: int) -> bool:
         """
         Post completion summary for a sales rep in their thread.
@@ -196,23 +302,14 @@ class SlackClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
 
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("ok", False)
-                else:
-                    print(f"[ERROR] HTTP {response.status_code}: {response.text}")
-                    return False
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result.get("ok", False)
+            else:
+                print(f"[ERROR] HTTP {response.status_code}: {response.text}")
+                return False
 
         except Exception as e:
             print(f"[ERROR] Failed to post completion summary for {rep_email}: {e}")
@@ -234,7 +331,7 @@ class SlackClient:
 
         # Calculate average score for this rep
         avg_score = sum(c.meddpicc_scores.overall_score for c in calls) / len(calls)
-        emoji = "🟢" if avg_score >= 4.0 else "🟡" if avg_score >= 2.5 else "🔴"
+        emoji = _score_emoji(avg_score)
 
         # Main thread post
         main_message = {
@@ -262,69 +359,37 @@ class SlackClient:
 
         try:
             # Post main thread message
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.webhook_url,
-                    json=main_message,
-                    timeout=10.0,
-                )
-
-                if response.status_code != 200:
-                    print(f"[ERROR] Failed to post thread for {rep_email}: {response.text}")
-                    return False
+            response = await self._client.post(self.webhook_url, content=orjson.dumps(main_message))
 
-                # Note: Slack incoming webhooks don't support threading
-                # So we'll post individual calls as separate messages
-                # But we'll make them clearly belong together by formatting
+            if response.status_code != 200:
+                print(f"[ERROR] Failed to post thread for {rep_email}: {response.text}")
+                return False
 
-                # Post each call
-                for call in sorted(calls, key=lambda c: c.call_date, reverse=True):
-                    call_message = self._build_call_message(call)
-                    await client.post(
-                        self.webhook_url,
-                        json=call_message,
-                        timeout=10.0,
-                    )
+            # Note: Slack incoming webhooks don't support threading
+            # So we'll post individual calls as separate messages
+            # But we'll make them clearly belong together by formatting
 
-                return True
+            # Post each call
+            for call in sorted(calls, key=_BY_CALL_DATE, reverse=True):
+                call_message = self._build_call_message(call)
+                await self._client.post(self.webhook_url, content=orjson.dumps(call_message))
+
+            return True
 
         except Exception as e:
             print(f"[ERROR] Failed to post thread for {rep_email}: {e}")
             return False
 
-    def _build_call_message(self, analysis: CallAnalysis) -> dict:
-        """Build a Slack message for a single call."""
-        s = analysis.meddpicc_scores
-        date = analysis.call_date.strftime("%Y-%m-%d")
-
-        # Color code based on score
-        if s.overall_score >= 4.0:
-            emoji = "🟢"
-        elif s.overall_score >= 2.5:
-            emoji = "🟡"
-        else:
-            emoji = "🔴"
-
-        # Build message
-        message_text = (
-            f"  {emoji} *<{analysis.gong_link}|{analysis.call_title}>*\n"
-            f"  📅 {date}\n\n"
-            f"  *MEDDPICC Score: {s.overall_score:.1f}/5.0*\n"
-            f"  M:{s.metrics} │ E:{s.economic_buyer} │ D:{s.decision_criteria} │ D:{s.decision_process}\n"
-            f"  P:{s.paper_process} │ I:{s.identify_pain} │ C:{s.champion} │ C:{s.competition}\n\n"
-        )
-
-        if analysis.meddpicc_summary:
-            message_text += f"  💡 _{analysis.meddpicc_summary}_"
-
+    def _build_call_message(self, analysis: CallAnalysis, indent: str = "  ") -> dict:
+        """Build a Slack message (fallback text and blocks) for a single call."""
         return {
-            "text": f"{analysis.call_title} - {s.overall_score}/5.0",
+            "text": f"{analysis.call_title} - {analysis.meddpicc_scores.overall_score}/5.0",
             "blocks": [
                 {
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": message_text,
+                        "text": self._build_call_eval_text(analysis, indent),
                     },
                 }
             ],
@@ -351,13 +416,8 @@ class SlackClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            response = await self._client.post(self.webhook_url, content=orjson.dumps(payload))
+            return response.status_code == 200
         except Exception as e:
             print(f"[ERROR] Failed to post to Slack: {e}")
             return False
@@ -366,14 +426,7 @@ class SlackClient:
         """Build Slack Block Kit message for a discovery call."""
         s = analysis.meddpicc_scores
         date = analysis.call_date.strftime("%Y-%m-%d")
-
-        # Color code based on score
-        if s.overall_score >= 4.0:
-            emoji = "🟢"  # Green - Strong
-        elif s.overall_score >= 2.5:
-            emoji = "🟡"  # Yellow - Moderate
-        else:
-            emoji = "🔴"  # Red - Weak
+        emoji = _score_emoji(s.overall_score)
 
         blocks = [
             # Header with sales rep
@@ -470,12 +523,17 @@ class SlackClient:
         if not discovery_calls:
             return await self._post_simple_summary(results)
 
-        # Calculate average score
-        avg_score = sum(r.meddpicc_scores.overall_score for r in discovery_calls) / len(discovery_calls)
+        # Average the overall score and every dimension in one pass over the calls
+        n = len(discovery_calls)
+        avg_score, *avg_dims = (
+            sum(column) / n
+            for column in zip(*(_SUMMARY_FIELDS(r.meddpicc_scores) for r in discovery_calls))
+        )
 
-        # Limit table to 30 rows to avoid exceeding Slack 3000 char limit
-        sorted_calls = sorted(discovery_calls, key=lambda r: (r.sales_rep_email, -r.meddpicc_scores.overall_score))
-        table_calls = sorted_calls[:30]
+        # Limit table to 30 rows to avoid exceeding Slack 3000 char limit (partial sort)
+        table_calls = heapq.nsmallest(
+            30, discovery_calls, key=lambda r: (r.sales_rep_email, -r.meddpicc_scores.overall_score)
+        )
 
         # Build header
         blocks = [
@@ -501,43 +559,32 @@ class SlackClient:
         ]
 
         # Build table header
-        table_text = "```\n"
+        parts = ["```\n"]
         if len(discovery_calls) > 30:
-            table_text += f"Showing top 30 of {len(discovery_calls)} calls (by rep, then score)\n\n"
-        table_text += "Rep              │ Score │ M E D D P I C C │ Call\n"
-        table_text += "─────────────────┼───────┼─────────────────┼─────────────────\n"
+            parts.append(f"Showing top 30 of {len(discovery_calls)} calls (by rep, then score)\n\n")
+        parts.append("Rep              │ Score │ M E D D P I C C │ Call\n")
+        parts.append("─────────────────┼───────┼─────────────────┼─────────────────\n")
 
         # Add rows for each discovery call, sorted by rep email then score
         for result in table_calls:
             s = result.meddpicc_scores
-            score = f"{s.overall_score:.1f}"
-            dimensions = f"{s.metrics} {s.economic_buyer} {s.decision_criteria} {s.decision_process} {s.paper_process} {s.identify_pain} {s.champion} {s.competition}"
-            rep = result.sales_rep_email.split('@')[0][:16].ljust(16)  # First part of email, truncated
+            dimensions = _SPACED_SCORES(*_MEDDPICC_FIELDS(s))
+            rep = result.sales_rep_email.split('@')[0][:16]  # First part of email, truncated
 
             # Call title truncated
             call_title = result.call_title[:20] + "..." if len(result.call_title) > 20 else result.call_title
 
-            table_text += f"{rep} │ {score.ljust(5)} │ {dimensions.ljust(15)} │ {call_title}\n"
+            parts.append(f"{rep:<16} │ {s.overall_score:<5.1f} │ {dimensions:<15} │ {call_title}\n")
 
         # Add separator and Overall Average row
-        table_text += "─────────────────┼───────┼─────────────────┼─────────────────\n"
-
-        # Calculate averages
-        avg_overall = sum(r.meddpicc_scores.overall_score for r in discovery_calls) / len(discovery_calls)
-        avg_metrics = sum(r.meddpicc_scores.metrics for r in discovery_calls) / len(discovery_calls)
-        avg_economic = sum(r.meddpicc_scores.economic_buyer for r in discovery_calls) / len(discovery_calls)
-        avg_decision_criteria = sum(r.meddpicc_scores.decision_criteria for r in discovery_calls) / len(discovery_calls)
-        avg_decision_process = sum(r.meddpicc_scores.decision_process for r in discovery_calls) / len(discovery_calls)
-        avg_paper = sum(r.meddpicc_scores.paper_process for r in discovery_calls) / len(discovery_calls)
-        avg_pain = sum(r.meddpicc_scores.identify_pain for r in discovery_calls) / len(discovery_calls)
-        avg_champion = sum(r.meddpicc_scores.champion for r in discovery_calls) / len(discovery_calls)
-        avg_competition = sum(r.meddpicc_scores.competition for r in discovery_calls) / len(discovery_calls)
+        parts.append("─────────────────┼───────┼─────────────────┼─────────────────\n")
 
-        avg_dimensions = f"{avg_metrics:.1f} {avg_economic:.1f} {avg_decision_criteria:.1f} {avg_decision_process:.1f} {avg_paper:.1f} {avg_pain:.1f} {avg_champion:.1f} {avg_competition:.1f}"
+        avg_dimensions = " ".join(f"{avg:.1f}" for avg in avg_dims)
 
-        table_text += f"{'Overall Average'.ljust(16)} │ {f'{avg_overall:.1f}'.ljust(5)} │ {avg_dimensions.ljust(15)} │\n"
+        parts.append(f"{'Overall Average':<16} │ {avg_score:<5.1f} │ {avg_dimensions:<15} │\n")
 
-        table_text += "```\n"
+        parts.append("```\n")
+        table_text = "".join(parts)
 
         blocks.append({
             "type": "section",
@@ -550,7 +597,7 @@ class SlackClient:
         # Add top call links (limit to top 20 to avoid exceeding 50 block limit)
         blocks.append({"type": "divider"})
 
-        top_calls = sorted(discovery_calls, key=lambda r: r.meddpicc_scores.overall_score, reverse=True)[:20]
+        top_calls = heapq.nlargest(20, discovery_calls, key=_BY_CALL_SCORE)
 
         if len(discovery_calls) <= 20:
             blocks.append({
@@ -570,7 +617,7 @@ class SlackClient:
             })
 
         for result in top_calls:
-            score_emoji = "🟢" if result.meddpicc_scores.overall_score >= 4.0 else "🟡" if result.meddpicc_scores.overall_score >= 2.5 else "🔴"
+            score_emoji = _score_emoji(result.meddpicc_scores.overall_score)
             blocks.append({
                 "type": "section",
                 "text": {
@@ -586,23 +633,14 @@ class SlackClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
 
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("ok", False)
-                else:
-                    print(f"[ERROR] HTTP {response.status_code}: {response.text}")
-                    return False
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result.get("ok", False)
+            else:
+                print(f"[ERROR] HTTP {response.status_code}: {response.text}")
+                return False
 
         except Exception as e:
             print(f"[ERROR] Failed to post summary table to Slack: {e}")
@@ -622,8 +660,7 @@ class SlackClient:
             return False
 
         # Limit to top 50 accounts to avoid exceeding Slack character limits
-        sorted_accounts = sorted(account_records, key=lambda a: a.overall_meddpicc.overall_score, reverse=True)
-        top_accounts = sorted_accounts[:50]
+        top_accounts = heapq.nlargest(50, account_records, key=_BY_ACCOUNT_SCORE)
         total_accounts = len(account_records)
 
         # Build table header
@@ -637,19 +674,16 @@ class SlackClient:
         rows = []
         for account in top_accounts:
             domain = account.domain[:23]  # Truncate if needed
-            calls_count = len(account.calls)
-            overall = account.overall_meddpicc.overall_score
-
-            # MEDDPICC compact format: M:4 E:3 DC:4...
             m = account.overall_meddpicc
-            meddpicc_str = f"{m.metrics}|{m.economic_buyer}|{m.decision_criteria}|{m.decision_process}|{m.paper_process}|{m.identify_pain}|{m.champion}|{m.competition}"
 
-            row = f"│ {domain:<23} │ {calls_count:>5} │ {overall:>7.2f} │ {meddpicc_str:<43} │\n"
-            rows.append(row)
+            # MEDDPICC compact format: 4|3|4...
+            meddpicc_str = _PIPED_SCORES(*_MEDDPICC_FIELDS(m))
+
+            rows.append(f"│ {domain:<23} │ {len(account.calls):>5} │ {m.overall_score:>7.2f} │ {meddpicc_str:<43} │\n")
 
         footer = "└─────────────────────────┴───────┴─────────┴─────────────────────────────────────────────┘"
 
-        table = header + "".join(rows) + footer
+        table = "".join([header, *rows, footer])
 
         # Create Slack blocks
         blocks = [
@@ -693,29 +727,22 @@ class SlackClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
 
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("ok", False)
-                else:
-                    print(f"[ERROR] HTTP {response.status_code}: {response.text}")
-                    return False
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result.get("ok", False)
+            else:
+                print(f"[ERROR] HTTP {response.status_code}: {response.text}")
+                return False
 
         except Exception as e:
             print(f"[ERROR] Failed to post account summary table to Slack: {e}")
             return False
 
-    async def post_summary_table_batched(self, results: list[CallAnalysis], batch_size: int = 25) -> bool:
+    async def post_summary_table_batched(
+        self, results: AsyncIterable[CallAnalysis], batch_size: int = 25
+    ) -> bool:
         """
         Post call summary table in batches, grouped by sales rep.
 
@@ -723,30 +750,42 @@ class SlackClient:
         This ensures batches never mix calls from different reps.
 
         Args:
-            results: List of CallAnalysis objects
+            results: Async iterable of CallAnalysis objects (consumed once)
             batch_size: Number of calls per batch (default 25)
 
         Returns:
             True if all batches posted successfully
         """
-        discovery_calls = [r for r in results if r.is_discovery_call and r.meddpicc_scores]
+        # Reduce each call to the fields the table renders as it streams in,
+        # so full analyses (transcript summaries, notes) are never held at once
+        calls_by_rep = defaultdict(list)
+        non_discovery = []
+        total_score = 0.0
+        async for result in results:
+            if not (result.is_discovery_call and result.meddpicc_scores):
+                non_discovery.append(result)
+                continue
 
-        if not discovery_calls:
-            return await self._post_simple_summary(results)
+            s = result.meddpicc_scores
+            total_score += s.overall_score
+            calls_by_rep[result.sales_rep_email].append((
+                s.overall_score,
+                _SPACED_SCORES(*_MEDDPICC_FIELDS(s)),
+                result.call_title,
+                result.gong_link,
+            ))
+
+        num_discovery = sum(len(calls) for calls in calls_by_rep.values())
+        if not num_discovery:
+            return await self._post_simple_summary(non_discovery)
 
         # Calculate overall stats
-        avg_score = sum(r.meddpicc_scores.overall_score for r in discovery_calls) / len(discovery_calls)
-
-        # Group calls by sales rep
-        from collections import defaultdict
-        calls_by_rep = defaultdict(list)
-        for call in discovery_calls:
-            calls_by_rep[call.sales_rep_email].append(call)
+        avg_score = total_score / num_discovery
 
         # Sort reps alphabetically and sort calls within each rep by score
         sorted_reps = sorted(calls_by_rep.keys())
         for rep in sorted_reps:
-            calls_by_rep[rep].sort(key=lambda r: -r.meddpicc_scores.overall_score)
+            calls_by_rep[rep].sort(key=itemgetter(0), reverse=True)
 
         # Calculate total batches across all reps
         total_batches = sum((len(calls) + batch_size - 1) // batch_size for calls in calls_by_rep.values())
@@ -765,7 +804,7 @@ class SlackClient:
                 "text": {
                     "type": "mrkdwn",
                     "text": (
-                        f"*Total Discovery Calls:* {len(discovery_calls)}\n"
+                        f"*Total Discovery Calls:* {num_discovery}\n"
                         f"*Sales Reps:* {len(sorted_reps)}\n"
                         f"*Average Score:* {avg_score:.2f}/5.0\n"
                         f"*Total Batches:* {total_batches}"
@@ -777,32 +816,23 @@ class SlackClient:
 
         payload = {
             "channel": self.channel_id,
-            "text": f"Discovery Calls Summary: {len(discovery_calls)} calls",
+            "text": f"Discovery Calls Summary: {num_discovery} calls",
             "blocks": header_blocks,
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
 
-                if response.status_code != 200 or not response.json().get("ok"):
-                    print(f"[ERROR] Failed to post header: {response.text}")
-                    return False
+            if response.status_code != 200 or not orjson.loads(response.content).get("ok"):
+                print(f"[ERROR] Failed to post header: {response.text}")
+                return False
 
             # Post batches grouped by rep
             global_batch_num = 0
             for rep_email in sorted_reps:
                 rep_calls = calls_by_rep[rep_email]
                 rep_batches = (len(rep_calls) + batch_size - 1) // batch_size
-                rep_avg_score = sum(c.meddpicc_scores.overall_score for c in rep_calls) / len(rep_calls)
+                rep_avg_score = sum(c[0] for c in rep_calls) / len(rep_calls)
 
                 # Post rep header
                 rep_header_blocks = [
@@ -824,20 +854,11 @@ class SlackClient:
                     "blocks": rep_header_blocks,
                 }
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.api_url,
-                        headers={
-                            "Authorization": f"Bearer {self.bot_token}",
-                            "Content-Type": "application/json",
-                        },
-                        json=rep_header_payload,
-                        timeout=10.0,
-                    )
+                response = await self._client.post(self.api_url, content=orjson.dumps(rep_header_payload))
 
-                    if response.status_code != 200 or not response.json().get("ok"):
-                        print(f"[ERROR] Failed to post rep header for {rep_email}: {response.text}")
-                        return False
+                if response.status_code != 200 or not orjson.loads(response.content).get("ok"):
+                    print(f"[ERROR] Failed to post rep header for {rep_email}: {response.text}")
+                    return False
 
                 # Post batches for this rep
                 for rep_batch_num, i in enumerate(range(0, len(rep_calls), batch_size), 1):
@@ -846,27 +867,25 @@ class SlackClient:
 
                     # Build table for this batch
                     if rep_batches > 1:
-                        table_text = f"```\nBatch {rep_batch_num}/{rep_batches} for {rep_email.split('@')[0]}\n\n"
+                        parts = [f"```\nBatch {rep_batch_num}/{rep_batches} for {rep_email.split('@')[0]}\n\n"]
                     else:
-                        table_text = "```\n"
+                        parts = ["```\n"]
 
-                    table_text += "Score │ M E D D P I C C │ Call\n"
-                    table_text += "──────┼─────────────────┼─────────────────────────────\n"
+                    parts.append("Score │ M E D D P I C C │ Call\n")
+                    parts.append("──────┼─────────────────┼─────────────────────────────\n")
 
-                    for result in batch:
-                        s = result.meddpicc_scores
-                        score = f"{s.overall_score:.1f}"
-                        dimensions = f"{s.metrics} {s.economic_buyer} {s.decision_criteria} {s.decision_process} {s.paper_process} {s.identify_pain} {s.champion} {s.competition}"
-                        call_title = result.call_title[:30] + "..." if len(result.call_title) > 30 else result.call_title
+                    for overall_score, dimensions, title, _ in batch:
+                        call_title = title[:30] + "..." if len(title) > 30 else title
 
-                        table_text += f"{score.ljust(5)} │ {dimensions.ljust(15)} │ {call_title}\n"
+                        parts.append(f"{overall_score:<5.1f} │ {dimensions:<15} │ {call_title}\n")
 
-                    table_text += "```"
+                    parts.append("```")
+                    table_text = "".join(parts)
 
                     # Build call links for this batch
                     links_text = "\n".join([
-                        f"• <{r.gong_link}|{r.call_title[:60]}> ({r.meddpicc_scores.overall_score:.1f})"
-                        for r in batch
+                        f"• <{gong_link}|{title[:60]}> ({overall_score:.1f})"
+                        for overall_score, _, title, gong_link in batch
                     ])
 
                     batch_blocks = [
@@ -896,23 +915,15 @@ class SlackClient:
                         "blocks": batch_blocks,
                     }
 
-                    async with httpx.AsyncClient() as client:
-                        response = await client.post(
-                            self.api_url,
-                            headers={
-                                "Authorization": f"Bearer {self.bot_token}",
-                                "Content-Type": "application/json",
-                            },
-                            json=batch_payload,
-                            timeout=10.0,
-                        )
+                    response = await self._client.post(self.api_url, content=orjson.dumps(batch_payload))
 
-                        if response.status_code != 200 or not response.json().get("ok"):
-                            print(f"[ERROR] Failed to post batch {global_batch_num}: {response.text}")
-                            return False
+                    if response.status_code != 200 or not orjson.loads(response.content).get("ok"):
+                        print(f"[ERROR] Failed to post batch {global_batch_num}: {response.text}")
+                        return False
 
-                    # Small delay between batches to avoid rate limiting
-                    await asyncio.sleep(1)
+                    # Small delay between batches to avoid rate limiting (nothing follows the last)
+                    if global_batch_num < total_batches:
+                        await asyncio.sleep(1)
 
             return True
 
@@ -935,7 +946,7 @@ class SlackClient:
             return False
 
         # Sort by overall score
-        sorted_accounts = sorted(account_records, key=lambda a: a.overall_meddpicc.overall_score, reverse=True)
+        sorted_accounts = sorted(account_records, key=_BY_ACCOUNT_SCORE, reverse=True)
         total_batches = (len(sorted_accounts) + batch_size - 1) // batch_size
 
         # Post header
@@ -967,41 +978,31 @@ class SlackClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
 
-                if response.status_code != 200 or not response.json().get("ok"):
-                    print(f"[ERROR] Failed to post header: {response.text}")
-                    return False
+            if response.status_code != 200 or not orjson.loads(response.content).get("ok"):
+                print(f"[ERROR] Failed to post header: {response.text}")
+                return False
 
             # Post batches
             for batch_num, i in enumerate(range(0, len(sorted_accounts), batch_size), 1):
                 batch = sorted_accounts[i:i + batch_size]
 
                 # Build table for this batch
-                table_text = f"```\nBatch {batch_num}/{total_batches}\n\n"
-                table_text += "Account Domain          │ Calls │ Overall │ M│E│DC│DP│PP│IP│CH│CO\n"
-                table_text += "────────────────────────┼───────┼─────────┼──────────────────────\n"
+                parts = [
+                    f"```\nBatch {batch_num}/{total_batches}\n\n",
+                    "Account Domain          │ Calls │ Overall │ M│E│DC│DP│PP│IP│CH│CO\n",
+                    "────────────────────────┼───────┼─────────┼──────────────────────\n",
+                ]
 
                 for account in batch:
-                    domain = account.domain[:23].ljust(23)
-                    calls_count = f"{len(account.calls):>5}"
-                    overall = f"{account.overall_meddpicc.overall_score:>7.2f}"
-
                     m = account.overall_meddpicc
-                    meddpicc_str = f"{m.metrics}│{m.economic_buyer}│{m.decision_criteria}│{m.decision_process}│{m.paper_process}│{m.identify_pain}│{m.champion}│{m.competition}"
+                    meddpicc_str = _BOXED_SCORES(*_MEDDPICC_FIELDS(m))
 
-                    table_text += f"{domain} │ {calls_count} │ {overall} │ {meddpicc_str}\n"
+                    parts.append(f"{account.domain[:23]:<23} │ {len(account.calls):>5} │ {m.overall_score:>7.2f} │ {meddpicc_str}\n")
 
-                table_text += "```"
+                parts.append("```")
+                table_text = "".join(parts)
 
                 batch_blocks = [
                     {
@@ -1023,23 +1024,15 @@ class SlackClient:
                     "blocks": batch_blocks,
                 }
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.api_url,
-                        headers={
-                            "Authorization": f"Bearer {self.bot_token}",
-                            "Content-Type": "application/json",
-                        },
-                        json=batch_payload,
-                        timeout=10.0,
-                    )
+                response = await self._client.post(self.api_url, content=orjson.dumps(batch_payload))
 
-                    if response.status_code != 200 or not response.json().get("ok"):
-                        print(f"[ERROR] Failed to post batch {batch_num}: {response.text}")
-                        return False
+                if response.status_code != 200 or not orjson.loads(response.content).get("ok"):
+                    print(f"[ERROR] Failed to post batch {batch_num}: {response.text}")
+                    return False
 
-                # Small delay between batches to avoid rate limiting
-                await asyncio.sleep(1)
+                # Small delay between batches to avoid rate limiting (nothing follows the last)
+                if batch_num < total_batches:
+                    await asyncio.sleep(1)
 
             return True
 
@@ -1067,22 +1060,13 @@ class SlackClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.bot_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await self._client.post(self.api_url, content=orjson.dumps(payload))
 
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("ok", False)
-                else:
-                    return False
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result.get("ok", False)
+            else:
+                return False
 
         except Exception as e:
             print(f"[ERROR] Failed to post summary to Slack: {e}")
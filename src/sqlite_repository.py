@@ -2,29 +2,70 @@
 
 import json
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
-from .models import AccountCall, AccountRecord, CallAnalysis, MEDDPICCScores
+from pydantic import TypeAdapter
+
+from .models import MEDDPICC_DIMENSIONS, AccountCall, AccountRecord, CallAnalysis, MEDDPICCScores
 from .repository import CallRepository
 
+_SCORE_FIELD_NAMES = MEDDPICC_DIMENSIONS + ("overall_score",)
+_SCORE_FIELDS = attrgetter(*_SCORE_FIELD_NAMES)
+_ACCOUNT_CALLS = TypeAdapter(list[AccountCall])
+# Stay well under SQLite's bound-parameter limit (999 on older builds)
+_MAX_IN_PARAMS = 500
+_ACCOUNT_COLUMNS = "domain, created_at, updated_at, calls, overall_meddpicc"
+_DISCOVERY_CALLS_QUERY = """
+    SELECT domain, call_id, call_date, sales_rep, external_participants,
+           meddpicc_scores, meddpicc_summary
+    FROM discovery_calls_view
+    ORDER BY domain
+"""
+
+
+def _row_to_account(row: tuple) -> AccountRecord:
+    """Hydrate an accounts row, validating the JSON columns directly in pydantic-core."""
+    domain, created_at, updated_at, calls_json, overall_json = row
+    return AccountRecord(
+        domain=domain,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+        calls=_ACCOUNT_CALLS.validate_json(calls_json),
+        overall_meddpicc=MEDDPICCScores.model_validate_json(overall_json),
+    )
+
 
 class SQLiteCallRepository(CallRepository):
     """SQLite-based storage for account call history."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, wal_mode: bool = True):
         """
         Initialize SQLite repository.
 
         Args:
             db_path: Path to SQLite database file
+            wal_mode: Use write-ahead logging so readers don't block writers
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(str(self.db_path))
+        self._configure_connection(wal_mode)
         self._init_db()
 
+    def _configure_connection(self, wal_mode: bool):
+        """Apply connection-level PRAGMAs."""
+        if wal_mode:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            # NORMAL is durable across application crashes when running in WAL mode
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MB
+        self.conn.execute("PRAGMA mmap_size=2147483648")  # 2 GB, read pages without copying
+        self.conn.execute("PRAGMA busy_timeout=5000")
+
     def _init_db(self):
         """Initialize database schema."""
         # Account-level MEDDPICC data (discovery calls only)
@@ -48,6 +89,30 @@ class SQLiteCallRepository(CallRepository):
             )
         """)
 
+        # LLM results keyed by transcript content hash (skips repeat LLM calls)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+
+        # One row per discovery call, flattened out of accounts.calls, with just the
+        # columns summaries need (skips the bulky per-dimension analysis notes)
+        self.conn.execute("""
+            CREATE VIEW IF NOT EXISTS discovery_calls_view AS
+            SELECT
+                a.domain AS domain,
+                json_extract(c.value, '$.call_id') AS call_id,
+                json_extract(c.value, '$.call_date') AS call_date,
+                json_extract(c.value, '$.sales_rep') AS sales_rep,
+                json_extract(c.value, '$.external_participants') AS external_participants,
+                json_extract(c.value, '$.meddpicc_scores') AS meddpicc_scores,
+                json_extract(c.value, '$.meddpicc_summary') AS meddpicc_summary
+            FROM accounts a, json_each(a.calls) c
+        """)
+
         # Sales rep attributes
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS sales_reps (
@@ -60,26 +125,41 @@ class SQLiteCallRepository(CallRepository):
         """)
         self.conn.commit()
 
+    def _select_in(self, query: str, values: list[str]) -> Iterator[tuple]:
+        """
+        Run a query with an IN (...) list, chunked to stay under SQLite's parameter limit.
+
+        Args:
+            query: SQL with a single ``{}`` where the IN placeholders go
+            values: Values to bind into the IN list
+
+        Yields:
+            Result rows from every chunk
+        """
+        for i in range(0, len(values), _MAX_IN_PARAMS):
+            batch = values[i:i + _MAX_IN_PARAMS]
+            yield from self.conn.execute(query.format(",".join("?" * len(batch))), batch)
+
     async def get_account(self, domain: str) -> Optional[AccountRecord]:
         """Get account record by domain."""
         cursor = self.conn.execute(
-            "SELECT domain, created_at, updated_at, calls, overall_meddpicc FROM accounts WHERE domain = ?",
+            f"SELECT {_ACCOUNT_COLUMNS} FROM accounts WHERE domain = ?",
             (domain,),
         )
         row = cursor.fetchone()
 
-        if not row:
-            return None
+        return _row_to_account(row) if row else None
 
-        domain, created_at, updated_at, calls_json, overall_json = row
-
-        return AccountRecord(
-            domain=domain,
-            created_at=datetime.fromisoformat(created_at),
-            updated_at=datetime.fromisoformat(updated_at),
-            calls=[AccountCall(**c) for c in json.loads(calls_json)],
-            overall_meddpicc=MEDDPICCScores(**json.loads(overall_json)),
+    async def get_accounts(self, domains: list[str]) -> dict[str, AccountRecord]:
+        """Get account records for several domains."""
+        accounts = {}
+        rows = self._select_in(
+            f"SELECT {_ACCOUNT_COLUMNS} FROM accounts WHERE domain IN ({{}})", domains
         )
+        for row in rows:
+            account = _row_to_account(row)
+            accounts[account.domain] = account
+        return accounts
 
     async def upsert_account(self, account: AccountRecord) -> None:
         """Insert or update account record."""
@@ -102,36 +182,49 @@ class SQLiteCallRepository(CallRepository):
         self, domain: str, call_analysis: CallAnalysis
     ) -> AccountRecord:
         """Add a discovery call and update overall MEDDPICC."""
-        # Get existing account or create new
+        return await self.add_discovery_calls(domain, [call_analysis])
+
+    async def add_discovery_calls(
+        self, domain: str, call_analyses: list[CallAnalysis]
+    ) -> AccountRecord:
+        """Add discovery calls with one read, one MEDDPICC recalculation and one write."""
+        if not call_analyses:
+            raise ValueError(f"No discovery calls to add for {domain}")
+
+        # Get existing account, if any
         account = await self.get_account(domain)
+        if account is not None:
+            # A run that stopped before marking its calls evaluated re-adds them; keep one copy
+            stored_ids = {call.call_id for call in account.calls}
+            call_analyses = [c for c in call_analyses if c.call_id not in stored_ids]
+            if not call_analyses:
+                return account
 
-        # Extract external participants
-        external_participants = call_analysis.participants.external
-
-        # Create call record with reasoning and notes
-        new_call = AccountCall(
-            call_id=call_analysis.call_id,
-            call_date=call_analysis.call_date,
-            sales_rep=call_analysis.sales_rep_email,
-            external_participants=external_participants,
-            meddpicc_scores=call_analysis.meddpicc_scores,
-            meddpicc_summary=call_analysis.meddpicc_summary,
-            analysis_notes=call_analysis.analysis_notes,
-        )
+        # Create call records with reasoning and notes
+        new_calls = [
+            AccountCall(
+                call_id=call_analysis.call_id,
+                call_date=call_analysis.call_date,
+                sales_rep=call_analysis.sales_rep_email,
+                external_participants=call_analysis.participants.external,
+                meddpicc_scores=call_analysis.meddpicc_scores,
+                meddpicc_summary=call_analysis.meddpicc_summary,
+                analysis_notes=call_analysis.analysis_notes,
+            )
+            for call_analysis in call_analyses
+        ]
 
         if account is None:
-            # Create new account
             account = AccountRecord(
                 domain=domain,
-                created_at=call_analysis.call_date,
-                updated_at=call_analysis.call_date,
-                calls=[new_call],
-                overall_meddpicc=call_analysis.meddpicc_scores,
+                created_at=call_analyses[0].call_date,
+                updated_at=call_analyses[-1].call_date,
+                calls=new_calls,
+                overall_meddpicc=self._calculate_overall_meddpicc(new_calls),
             )
         else:
-            # Update existing account
-            account.calls.append(new_call)
-            account.updated_at = call_analysis.call_date
+            account.calls.extend(new_calls)
+            account.updated_at = call_analyses[-1].call_date
 
             # Recalculate overall MEDDPICC (max of each dimension)
             account.overall_meddpicc = self._calculate_overall_meddpicc(account.calls)
@@ -143,43 +236,49 @@ class SQLiteCallRepository(CallRepository):
 
     def _calculate_overall_meddpicc(self, calls: list[AccountCall]) -> MEDDPICCScores:
         """Calculate overall MEDDPICC as max of each dimension across all calls."""
-        all_scores = [call.meddpicc_scores for call in calls]
-
-        return MEDDPICCScores(
-            metrics=max(s.metrics for s in all_scores),
-            economic_buyer=max(s.economic_buyer for s in all_scores),
-            decision_criteria=max(s.decision_criteria for s in all_scores),
-            decision_process=max(s.decision_process for s in all_scores),
-            paper_process=max(s.paper_process for s in all_scores),
-            identify_pain=max(s.identify_pain for s in all_scores),
-            champion=max(s.champion for s in all_scores),
-            competition=max(s.competition for s in all_scores),
-            overall_score=max(s.overall_score for s in all_scores),
-        )
+        # Read every score once, then take column-wise maxima over the transposed rows
+        rows = (_SCORE_FIELDS(call.meddpicc_scores) for call in calls)
+        maxima = [max(column) for column in zip(*rows)]
+
+        return MEDDPICCScores(**dict(zip(_SCORE_FIELD_NAMES, maxima)))
 
     async def list_domains(self) -> list[str]:
         """List all tracked domains."""
         cursor = self.conn.execute("SELECT domain FROM accounts ORDER BY domain")
         return [row[0] for row in cursor.fetchall()]
 
-    async def get_all_accounts(self) -> list[AccountRecord]:
-        """Get all account records."""
+    async def iter_accounts(self, batch_size: int = 100) -> AsyncIterator[AccountRecord]:
+        """Stream all account records in domain order."""
+        # Accounts embed their calls, so one scan hydrates everything (no per-account queries)
+        cursor = self.conn.execute(
+            f"SELECT {_ACCOUNT_COLUMNS} FROM accounts ORDER BY domain"
+        )
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield _row_to_account(row)
+
+    async def get_account_stats(self) -> tuple[int, int]:
+        """Count tracked accounts and their discovery calls."""
         cursor = self.conn.execute(
-            "SELECT domain, created_at, updated_at, calls, overall_meddpicc FROM accounts ORDER BY domain"
+            "SELECT COUNT(*), COALESCE(SUM(json_array_length(calls)), 0) FROM accounts"
         )
-        accounts = []
-        for row in cursor.fetchall():
-            domain, created_at, updated_at, calls_json, overall_json = row
-            accounts.append(
-                AccountRecord(
-                    domain=domain,
-                    created_at=datetime.fromisoformat(created_at),
-                    updated_at=datetime.fromisoformat(updated_at),
-                    calls=[AccountCall(**c) for c in json.loads(calls_json)],
-                    overall_meddpicc=MEDDPICCScores(**json.loads(overall_json)),
+        return cursor.fetchone()
+
+    async def iter_account_calls(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[tuple[str, AccountCall]]:
+        """Stream every discovery call without loading whole accounts."""
+        cursor = self.conn.execute(_DISCOVERY_CALLS_QUERY)
+        while rows := cursor.fetchmany(batch_size):
+            for domain, call_id, call_date, sales_rep, external, scores_json, summary in rows:
+                yield domain, AccountCall(
+                    call_id=call_id,
+                    call_date=call_date,
+                    sales_rep=sales_rep,
+                    external_participants=json.loads(external),
+                    meddpicc_scores=MEDDPICCScores.model_validate_json(scores_json),
+                    meddpicc_summary=summary,
                 )
-            )
-        return accounts
 
     async def call_exists(self, call_id: str) -> bool:
         """Check if a call has already been evaluated."""
@@ -189,6 +288,13 @@ class SQLiteCallRepository(CallRepository):
         )
         return cursor.fetchone() is not None
 
+    async def get_existing_call_ids(self, call_ids: list[str]) -> set[str]:
+        """Find which of the given calls have already been evaluated."""
+        rows = self._select_in(
+            "SELECT call_id FROM evaluated_calls WHERE call_id IN ({})", call_ids
+        )
+        return {row[0] for row in rows}
+
     async def store_evaluated_call(
         self, call_id: str, is_discovery: bool, reason: Optional[str] = None
     ) -> None:
@@ -207,13 +313,56 @@ class SQLiteCallRepository(CallRepository):
             """,
             (
                 call_id,
-                datetime.now().isoformat(),
+                datetime.now(timezone.utc).isoformat(),
                 1 if is_discovery else 0,
                 reason if not is_discovery else None,
             ),
         )
         self.conn.commit()
 
+    async def get_llm_cache(self, cache_key: str) -> Optional[dict]:
+        """Get a cached LLM result."""
+        cursor = self.conn.execute(
+            "SELECT result FROM llm_cache WHERE cache_key = ?",
+            (cache_key,)
+        )
+        row = cursor.fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def store_llm_cache(self, cache_key: str, result: dict) -> None:
+        """Cache an LLM result."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (cache_key, result, created_at) VALUES (?, ?, ?)",
+            (cache_key, json.dumps(result), datetime.now(timezone.utc).isoformat()),
+        )
+        self.conn.commit()
+
+    async def explain_query_plans(self) -> dict[str, list[str]]:
+        """
+        Run EXPLAIN QUERY PLAN for the repository's hot queries.
+
+        Every lookup should be a SEARCH on a primary key and every ordered read
+        a SCAN using one; a bare SCAN or a "USE TEMP B-TREE" step means the
+        planner is missing (or misusing) an index.
+
+        Returns:
+            Plan detail lines keyed by repository method name
+        """
+        queries = {
+            "get_account": (f"SELECT {_ACCOUNT_COLUMNS} FROM accounts WHERE domain = ?", ("",)),
+            "get_all_accounts": (f"SELECT {_ACCOUNT_COLUMNS} FROM accounts ORDER BY domain", ()),
+            "iter_account_calls": (_DISCOVERY_CALLS_QUERY, ()),
+            "call_exists": ("SELECT 1 FROM evaluated_calls WHERE call_id = ?", ("",)),
+            "get_existing_call_ids": ("SELECT call_id FROM evaluated_calls WHERE call_id IN (?, ?)", ("", "")),
+            "get_llm_cache": ("SELECT result FROM llm_cache WHERE cache_key = ?", ("",)),
+        }
+        return {
+            name: [row[3] for row in self.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+            for name, (sql, params) in queries.items()
+        }
+
     async def close(self) -> None:
         """Close database connection."""
+        # Let SQLite refresh planner statistics for the queries this connection ran
+        self.conn.execute("PRAGMA optimize")
         self.conn.close()
@@ -32,6 +32,9 @@ async def main():
     # Create test database in scratchpad
     db_path = "/tmp/test_calls.db"
     print(f"\n📦 Creating test database: {db_path}")
+    # Start from an empty database so the counts checked below are exact
+    for suffix in ("", "-wal", "-shm"):
+        Path(db_path + suffix).unlink(missing_ok=True)
     repo = SQLiteCallRepository(db_path)
 
     try:
@@ -197,6 +200,106 @@ async def main():
                 f"{call.call_id} (score: {call.meddpicc_scores.overall_score}/5.0)"
             )
 
+        # Verify hot lookups are served by primary key indexes, not table scans
+        print("\n6️⃣  Checking query plans for primary key lookups...")
+        hot_queries = [
+            ("SELECT 1 FROM evaluated_calls WHERE call_id = ?", ("call-001",)),
+            ("SELECT call_id FROM evaluated_calls WHERE call_id IN (?, ?)", ("call-001", "call-002")),
+            ("SELECT result FROM llm_cache WHERE cache_key = ?", ("discovery:abc",)),
+            ("SELECT email FROM sales_reps WHERE email = ?", ("alice@ourcompany.com",)),
+            ("SELECT calls FROM accounts WHERE domain = ?", ("example.com",)),
+        ]
+        for query, params in hot_queries:
+            plan = repo.conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+            detail = " ".join(row[-1] for row in plan)
+            assert detail.startswith("SEARCH"), f"Expected index search for: {query}\n   Got: {detail}"
+            print(f"   ✓ {detail}")
+
+        # Add several calls for one domain in a single write
+        print("\n7️⃣  Adding two discovery calls for batch.com in one write...")
+        call4 = call3.model_copy(update={"call_id": "call-004"})
+        call5 = call2.model_copy(update={"call_id": "call-005", "call_date": datetime(2025, 1, 25, 9, 0, 0)})
+        account4 = await repo.add_discovery_calls("batch.com", [call4, call5])
+        assert [c.call_id for c in account4.calls] == ["call-004", "call-005"]
+        assert account4.created_at == call4.call_date
+        assert account4.updated_at == call5.call_date
+        assert account4.overall_meddpicc.economic_buyer == 4
+        assert account4.overall_meddpicc.overall_score == 3.75
+        stored = await repo.get_account("batch.com")
+        assert [c.call_id for c in stored.calls] == ["call-004", "call-005"]
+        try:
+            await repo.add_discovery_calls("batch.com", [])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("add_discovery_calls([]) should raise ValueError")
+        print(f"   ✓ Calls: {len(account4.calls)}, overall score {account4.overall_meddpicc.overall_score}/5.0")
+        print(f"   ✓ Empty batch rejected")
+
+        # A rerun after a crash re-adds calls that were stored but never marked evaluated
+        call6 = call3.model_copy(update={"call_id": "call-006", "call_date": datetime(2025, 1, 28, 9, 0, 0)})
+        account4 = await repo.add_discovery_calls("batch.com", [call4, call5])
+        assert [c.call_id for c in account4.calls] == ["call-004", "call-005"]
+        account4 = await repo.add_discovery_calls("batch.com", [call5, call6])
+        assert [c.call_id for c in account4.calls] == ["call-004", "call-005", "call-006"]
+        stored = await repo.get_account("batch.com")
+        assert [c.call_id for c in stored.calls] == ["call-004", "call-005", "call-006"]
+        print(f"   ✓ Re-added calls skipped, new call appended")
+
+        # Look up evaluated calls across more ids than fit in one IN (...) chunk
+        print("\n8️⃣  Checking evaluated call lookups...")
+        await repo.store_evaluated_call("call-001", True)
+        await repo.store_evaluated_call("call-x", False, "Internal sync")
+        for n in range(600):
+            await repo.store_evaluated_call(f"bulk-{n}", False, "Demo")
+        # Known ids sit on both sides of the first 500-id chunk boundary
+        candidates = [f"bulk-{n}" for n in range(1198, -1, -2)] + ["call-001", "call-x", "call-999"]
+        existing = await repo.get_existing_call_ids(candidates)
+        expected = {"call-001", "call-x"} | {f"bulk-{n}" for n in range(0, 600, 2)}
+        assert existing == expected, f"Unexpected ids: {sorted(existing ^ expected)[:5]}"
+        assert await repo.get_existing_call_ids([]) == set()
+        assert await repo.call_exists("call-x")
+        assert not await repo.call_exists("call-999")
+        print(f"   ✓ {len(existing)} of {len(candidates)} ids already evaluated")
+
+        accounts = await repo.get_accounts([f"d{n}.com" for n in range(600)] + ["missing.com", "example.com"])
+        assert sorted(accounts) == ["example.com"]
+        assert [c.call_id for c in accounts["example.com"].calls] == ["call-001", "call-002"]
+        print(f"   ✓ get_accounts found {len(accounts)} of 602 domains")
+
+        # Aggregate counts without hydrating accounts
+        print("\n9️⃣  Checking account stats...")
+        num_accounts, total_calls = await repo.get_account_stats()
+        assert (num_accounts, total_calls) == (3, 6), (num_accounts, total_calls)
+        print(f"   ✓ Accounts: {num_accounts}, discovery calls: {total_calls}")
+
+        # Stream calls straight out of the accounts' JSON
+        print("\n🔟 Streaming discovery calls...")
+        streamed = [item async for item in repo.iter_account_calls(batch_size=2)]
+        assert [domain for domain, _ in streamed] == sorted(domain for domain, _ in streamed)
+        assert sorted(call.call_id for _, call in streamed) == [
+            "call-001", "call-002", "call-003", "call-004", "call-005", "call-006"
+        ]
+        by_id = {call.call_id: (domain, call) for domain, call in streamed}
+        domain, call = by_id["call-002"]
+        assert domain == "example.com"
+        assert call.sales_rep == "alice@ourcompany.com"
+        assert call.call_date == call2.call_date
+        assert call.external_participants == ["bob@example.com", "dave@example.com"]
+        assert call.meddpicc_scores == call2.meddpicc_scores
+        assert call.meddpicc_summary == call2.meddpicc_summary
+        print(f"   ✓ Streamed {len(streamed)} calls")
+
+        # LLM result cache round trip
+        print("\n💾 Checking LLM result cache...")
+        assert await repo.get_llm_cache("discovery:abc") is None
+        result = {"is_discovery": True, "reasoning": "Pain discussed", "scores": [1, 2, 3]}
+        await repo.store_llm_cache("discovery:abc", result)
+        assert await repo.get_llm_cache("discovery:abc") == result
+        await repo.store_llm_cache("discovery:abc", {"is_discovery": False})
+        assert await repo.get_llm_cache("discovery:abc") == {"is_discovery": False}
+        print(f"   ✓ Stored, read back and overwrote a cached result")
+
         print("\n✅ Database integration test complete!")
 
     finally:
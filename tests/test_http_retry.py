@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test the retrying HTTP transport.
+
+Drives RetryTransport with a mock transport that returns scripted statuses
+and errors, recording backoff sleeps instead of waiting. No API keys required.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import http_retry
+from src.http_retry import RetryTransport
+from src.slack_client import SLACK_MAX_RETRIES, _SLACK_RETRY_EXCEPTIONS, _SLACK_RETRY_STATUSES
+
+# Backoff delays requested by the transport, in order
+sleeps: list[float] = []
+
+
+async def _record_sleep(delay: float) -> None:
+    sleeps.append(delay)
+
+
+# Record delays rather than sleeping; only the transport's module sees this
+http_retry.asyncio = SimpleNamespace(sleep=_record_sleep)
+
+
+def scripted(*outcomes):
+    """
+    Build a mock transport that plays back outcomes, one per attempt.
+
+    Each outcome is a status code, a (status, headers) pair or an exception
+    class to raise. The last outcome repeats once the script runs out.
+    """
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes[min(len(attempts), len(outcomes) - 1)]
+        attempts.append(outcome)
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome("scripted failure", request=request)
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        return httpx.Response(status, headers=headers)
+
+    return httpx.MockTransport(handler), attempts
+
+
+async def send(transport: httpx.AsyncBaseTransport, **retry) -> httpx.Response:
+    """Send one request through a RetryTransport wrapping the mock."""
+    sleeps.clear()
+    retry.setdefault("max_retries", 3)
+    retry.setdefault("backoff_factor", 1.0)
+    retry.setdefault("backoff", lambda prev: prev * 2)
+    async with httpx.AsyncClient(transport=RetryTransport(transport, **retry)) as client:
+        return await client.post("https://api.example.test/v1", content=b"{}")
+
+
+async def main():
+    """Test the retrying HTTP transport."""
+    print("=" * 70)
+    print("HTTP Retry Transport Test")
+    print("=" * 70)
+
+    # Rate limits and server errors are retried with growing backoff
+    print("\n1️⃣  Retrying 429 and 500 until success...")
+    transport, attempts = scripted(429, 500, 200)
+    resp = await send(transport)
+    assert resp.status_code == 200
+    assert attempts == [429, 500, 200]
+    assert sleeps == [2.0, 4.0], sleeps
+    print(f"   ✓ {len(attempts)} attempts, backoff {sleeps}")
+
+    # Retry-After overrides the backoff delay, capped at 60s
+    print("\n2️⃣  Honouring Retry-After...")
+    transport, attempts = scripted((429, {"Retry-After": "5"}), (503, {"Retry-After": "600"}), 200)
+    resp = await send(transport)
+    assert resp.status_code == 200
+    assert sleeps == [5.0, 60.0], sleeps
+    print(f"   ✓ Waited {sleeps} (second value capped from 600)")
+
+    transport, attempts = scripted((429, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}), 200)
+    resp = await send(transport)
+    assert sleeps == [2.0], sleeps
+    print("   ✓ Unparseable Retry-After falls back to the backoff delay")
+
+    # The last response is returned once retries run out
+    print("\n3️⃣  Giving up after max_retries...")
+    transport, attempts = scripted(503)
+    resp = await send(transport, max_retries=2)
+    assert resp.status_code == 503
+    assert len(attempts) == 3 and len(sleeps) == 2
+    print(f"   ✓ {len(attempts)} attempts, final status {resp.status_code} returned")
+
+    transport, attempts = scripted(400)
+    resp = await send(transport)
+    assert resp.status_code == 400 and len(attempts) == 1 and not sleeps
+    print("   ✓ Client errors are not retried")
+
+    # Network errors are retried, then re-raised
+    print("\n4️⃣  Retrying network errors...")
+    transport, attempts = scripted(httpx.ConnectError, httpx.ReadTimeout, 200)
+    resp = await send(transport)
+    assert resp.status_code == 200 and len(attempts) == 3
+    print(f"   ✓ Recovered after {len(attempts) - 1} network errors")
+
+    transport, attempts = scripted(httpx.ConnectError)
+    try:
+        await send(transport, max_retries=2)
+    except httpx.ConnectError:
+        pass
+    else:
+        raise AssertionError("ConnectError should be raised once retries run out")
+    assert len(attempts) == 3
+    print(f"   ✓ ConnectError raised after {len(attempts)} attempts")
+
+    # Slack posts aren't idempotent: only retry when the message certainly wasn't posted
+    print("\n5️⃣  Checking the Slack retry policy...")
+    slack = dict(
+        max_retries=SLACK_MAX_RETRIES,
+        retry_statuses=_SLACK_RETRY_STATUSES,
+        retry_exceptions=_SLACK_RETRY_EXCEPTIONS,
+    )
+    transport, attempts = scripted(429, 429, 200)
+    resp = await send(transport, **slack)
+    assert resp.status_code == 200 and len(attempts) == 3
+    print("   ✓ 429 is retried")
+
+    transport, attempts = scripted(500, 200)
+    resp = await send(transport, **slack)
+    assert resp.status_code == 500 and len(attempts) == 1
+    print("   ✓ 500 is returned without a retry")
+
+    transport, attempts = scripted(httpx.ConnectError, 200)
+    resp = await send(transport, **slack)
+    assert resp.status_code == 200 and len(attempts) == 2
+    print("   ✓ ConnectError is retried")
+
+    transport, attempts = scripted(httpx.ReadTimeout, 200)
+    try:
+        await send(transport, **slack)
+    except httpx.ReadTimeout:
+        pass
+    else:
+        raise AssertionError("ReadTimeout should not be retried for Slack posts")
+    assert len(attempts) == 1
+    print("   ✓ ReadTimeout is raised without a retry")
+
+    transport, attempts = scripted(429)
+    resp = await send(transport, **slack)
+    assert resp.status_code == 429 and len(attempts) == SLACK_MAX_RETRIES + 1
+    print(f"   ✓ Gives up on 429 after {len(attempts)} attempts")
+
+    print("\n✅ HTTP retry transport test complete!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test transcript truncation.
+
+Checks the head and head-plus-tail trimming applied before transcripts are
+sent to the LLM. No API keys required.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm_client import _ELISION, _truncate, _truncate_ends
+
+
+def make_transcript(num_lines: int, seed: int = 0) -> str:
+    """Build a speaker-tagged transcript with lines of varying length."""
+    rng = random.Random(seed)
+    words = ["budget", "timeline", "pain", "security", "review", "pricing", "next", "steps"]
+    return "\n".join(
+        f"[{'Rep' if n % 2 else 'Buyer'}]: " + " ".join(rng.choices(words, k=rng.randint(3, 20)))
+        for n in range(num_lines)
+    )
+
+
+def main():
+    """Test transcript truncation."""
+    print("=" * 70)
+    print("Transcript Truncation Test")
+    print("=" * 70)
+
+    transcript = make_transcript(400)
+
+    # Short transcripts pass through untouched
+    print("\n1️⃣  Short transcripts are returned as-is...")
+    short = make_transcript(5)
+    assert _truncate(short, len(short)) is short
+    assert _truncate_ends(short, len(short)) is short
+    print("   ✓ No copy, no marker")
+
+    # Head cut lands on a line boundary
+    print("\n2️⃣  Head truncation ends on a whole line...")
+    head = _truncate(transcript, 3000)
+    assert len(head) <= 3000
+    assert transcript.startswith(head)
+    assert transcript[len(head)] == "\n", "Cut should land just before a newline"
+    assert len(head) >= 3000 * 0.9
+    print(f"   ✓ Kept {len(head)} of {len(transcript)} chars, ending at a line break")
+
+    # Without a newline near the limit, the cut falls back to a word boundary
+    print("\n3️⃣  Head truncation falls back to a word boundary...")
+    one_line = transcript.replace("\n", " ")
+    head = _truncate(one_line, 3000)
+    assert len(head) <= 3000 and one_line.startswith(head)
+    assert one_line[len(head)] == " ", "Cut should land just before a space"
+    print(f"   ✓ Kept {len(head)} chars, ending at a word break")
+
+    # Text without whitespace is cut hard at the limit
+    no_spaces = "x" * 5000
+    assert _truncate(no_spaces, 3000) == "x" * 3000
+    print("   ✓ Unbroken text is cut at exactly the limit")
+
+    # Head-plus-tail keeps the opening and close around one marker
+    print("\n4️⃣  Head-and-tail truncation keeps both ends...")
+    limit = 6000
+    trimmed = _truncate_ends(transcript, limit)
+    assert len(trimmed) <= limit
+    assert trimmed.count(_ELISION) == 1
+    head, tail = trimmed.split(_ELISION)
+    assert head == _truncate(transcript, limit // 3)
+    assert transcript.endswith(tail)
+    tail_start = len(transcript) - len(tail)
+    assert transcript[tail_start - 1] == "\n", "Tail should start on a whole line"
+    assert tail.startswith("["), "Tail should start with a speaker tag"
+    assert len(tail) >= 2 * len(head) * 0.9, "Most of the budget should go to the close"
+    print(f"   ✓ Head {len(head)} chars + marker + tail {len(tail)} chars = {len(trimmed)} <= {limit}")
+
+    # Without newlines the tail starts on a word boundary instead
+    trimmed = _truncate_ends(one_line, limit)
+    head, tail = trimmed.split(_ELISION)
+    assert one_line.endswith(tail) and one_line[len(one_line) - len(tail) - 1] == " "
+    print("   ✓ Single-line tail starts on a whole word")
+
+    # Invariants across random sizes and budgets
+    print("\n5️⃣  Checking limits on random transcripts...")
+    rng = random.Random(42)
+    for seed in range(200):
+        text = make_transcript(rng.randint(1, 300), seed)
+        if rng.random() < 0.3:
+            text = text.replace("\n", " ")
+        limit = rng.randint(200, 20000)
+
+        head = _truncate(text, limit)
+        assert len(head) <= limit and text.startswith(head)
+
+        trimmed = _truncate_ends(text, limit)
+        assert len(trimmed) <= limit
+        if len(text) <= limit:
+            assert trimmed == text
+        else:
+            head, tail = trimmed.split(_ELISION)
+            assert text.startswith(head) and text.endswith(tail)
+    print("   ✓ 200 transcripts stay within budget, keeping a prefix and a suffix")
+
+    print("\n✅ Transcript truncation test complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,21 +33,20 @@ async def main():
     repo = SQLiteCallRepository(db_path)
 
     try:
-        # Get all domains
-        domains = await repo.list_domains()
+        num_accounts, _ = await repo.get_account_stats()
 
-        if not domains:
+        if not num_accounts:
             print("\n📭 No accounts in database yet.")
             print("   Run the analyzer with discovery calls to populate the database.")
             return
 
-        print(f"\n📊 Total Accounts: {len(domains)}\n")
+        print(f"\n📊 Total Accounts: {num_accounts}\n")
 
-        # Display each account
-        for i, domain in enumerate(domains, 1):
-            account = await repo.get_account(domain)
-
-            print(f"{i}. {domain}")
+        # Display each account as it streams in
+        i = 0
+        async for account in repo.iter_accounts():
+            i += 1
+            print(f"{i}. {account.domain}")
             print(f"   {'─' * 76}")
             print(f"   Created:  {account.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"   Updated:  {account.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -32,18 +32,14 @@ async def main():
     repo = SQLiteCallRepository(db_path)
 
     try:
-        domains = await repo.list_domains()
+        num_accounts, _ = await repo.get_account_stats()
 
-        if not domains:
+        if not num_accounts:
             print("\n📭 No accounts in database yet.")
             return
 
         # Find accounts with multiple calls
-        multi_call_accounts = []
-        for domain in domains:
-            account = await repo.get_account(domain)
-            if len(account.calls) > 1:
-                multi_call_accounts.append(account)
+        multi_call_accounts = [account async for account in repo.iter_accounts() if len(account.calls) > 1]
 
         if not multi_call_accounts:
             print("\n📊 No accounts with multiple discovery calls yet.")